@@ -6,27 +6,19 @@ This script systematically searches for the smallest NS that is non-serializable
 """
 
 import json
-import os
-import subprocess
+import sys
+from pathlib import Path
 
-def test_ns(ns, filename="test_ns.json"):
+# The shared build helper lives in the project's scripts/ directory
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "scripts"))
+from _ser_binary import ensure_built, run_on_json
+
+
+def test_ns(ns, binary):
     """Test if an NS is serializable."""
     try:
-        # Save NS to file
-        with open(filename, 'w') as f:
-            json.dump(ns, f, indent=2)
-        
         # Run checker
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(script_dir)))
-        
-        result = subprocess.run(
-            ['cargo', 'run', '--', filename],
-            cwd=project_root,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        result = run_on_json(binary, ns, timeout=10)
         
         output = result.stdout + result.stderr
         
@@ -43,10 +35,6 @@ def test_ns(ns, filename="test_ns.json"):
             
     except Exception as e:
         return None, str(e)
-    finally:
-        # Clean up
-        if os.path.exists(filename):
-            os.remove(filename)
 
 def compute_size(ns):
     """Compute the size of an NS."""
@@ -126,13 +114,15 @@ minimal_candidates = [
 def main():
     print("Searching for minimal non-serializable Network Systems...\n")
     
+    binary = ensure_built()
+    
     found_nonser = []
     
     for i, ns in enumerate(minimal_candidates):
         size = compute_size(ns)
         print(f"Testing candidate {i+1} (size={size})...")
         
-        is_ser, output = test_ns(ns)
+        is_ser, output = test_ns(ns, binary)
         
         if is_ser is False:
             print(f"  ✅ NON-SERIALIZABLE!")
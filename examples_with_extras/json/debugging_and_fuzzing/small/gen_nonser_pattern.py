@@ -10,17 +10,21 @@ requests that are executing simultaneously.
 import json
 import os
 import subprocess
+import sys
 import itertools
+from pathlib import Path
 
-def run_serializability_checker(filepath):
+# The shared build helper lives in the project's scripts/ directory
+sys.path.insert(0, str(Path(__file__).resolve().parents[4] / "scripts"))
+from _ser_binary import ensure_built, PROJECT_ROOT
+
+
+def run_serializability_checker(filepath, binary):
     """Run the serializability checker on a file."""
     try:
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(script_dir)))
-        
         result = subprocess.run(
-            ['cargo', 'run', '--', filepath],
-            cwd=project_root,
+            [str(binary), filepath],
+            cwd=PROJECT_ROOT,
             capture_output=True,
             text=True,
             timeout=30
@@ -175,6 +179,7 @@ def generate_minimal_nonser():
 
 def main():
     output_dir = os.path.dirname(os.path.abspath(__file__))
+    binary = ensure_built()
     
     patterns = [
         ("minimal", generate_minimal_nonser()),
@@ -203,7 +208,7 @@ def main():
         print(f"  Transitions: {len(ns['transitions'])}")
         
         # Test serializability
-        is_ser, has_error, output = run_serializability_checker(filepath)
+        is_ser, has_error, output = run_serializability_checker(filepath, binary)
         
         if has_error:
             print(f"  ⚠️  Error during checking")
@@ -0,0 +1,60 @@
+"""
+Shared loader for the serializability_stats.jsonl log read by the table and plot scripts.
+"""
+import hashlib
+import os
+import pickle
+from functools import lru_cache
+
+from _ser_binary import PROJECT_ROOT
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+# Parsed logs are pickled here, in the ignored out/ tree rather than beside the
+# (possibly tracked) data files
+CACHE_DIR = os.path.join(PROJECT_ROOT, "out", ".cache")
+
+
+def _cache_path(path):
+    """Cache location for the parsed form of path, named after its absolute path"""
+    name = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{name}.pickle")
+
+
+def load_records(path):
+    """Return the log's records as a list of dicts, reusing the last parse while the file is unchanged"""
+    st = os.stat(path)
+    return _load_records(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=4)
+def _load_records(path, mtime_ns, size):
+    """Parse (or unpickle) path; memoized per process so callers in one run share a single load"""
+    key = (mtime_ns, size)
+    cache = _cache_path(path)
+    try:
+        with open(cache, "rb") as f:
+            cached_key, records = pickle.load(f)
+        if cached_key == key:
+            return records
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass
+
+    # one read and a bytes split beats per-line iteration of the file object
+    with open(path, "rb") as f:
+        data = f.read()
+    records = [json_loads(line) for line in data.split(b"\n") if line.strip()]
+
+    try:
+        os.makedirs(os.path.dirname(cache), exist_ok=True)
+        tmp = cache + ".tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump((key, records), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache)
+    except OSError:
+        pass
+    return records
@@ -0,0 +1,32 @@
+"""
+Shared helper for scripts that drive the compiled ser binary.
+"""
+import json
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def ensure_built(project_root=PROJECT_ROOT):
+    """Build the release binary unless the build stamp is newer than every source file"""
+    sources = [project_root / "Cargo.toml", project_root / "build.rs", *(project_root / "src").rglob("*")]
+    src_mtime = max(p.stat().st_mtime for p in sources if p.is_file())
+    stamp = project_root / "target" / "release" / ".ser_build_ok"
+    if not stamp.exists() or stamp.stat().st_mtime < src_mtime:
+        subprocess.run(["cargo", "build", "--release"], cwd=project_root, check=True)
+        stamp.touch()
+    return project_root / "target" / "release" / "ser"
+
+
+def run_on_json(binary, data, timeout, cwd=PROJECT_ROOT):
+    """Run binary on data dumped to a private temp .json file, removing the file afterwards"""
+    # Unique per-call file, so concurrent callers never clobber each other
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as tf:
+        json.dump(data, tf, indent=2)
+    try:
+        return subprocess.run([str(binary), tf.name], cwd=cwd, capture_output=True, text=True, timeout=timeout)
+    finally:
+        os.unlink(tf.name)
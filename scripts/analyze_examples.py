@@ -8,102 +8,212 @@ Usage: python3 analyze_examples.py [--timeout <seconds>] [--jobs <number>] [--us
 """
 
 import argparse
+import atexit
+import hashlib
+import json
+import re
 import subprocess
+import sys
+import threading
 import time
 import os
-import re
+import resource
+import signal
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime
+from typing import Optional
 
+from _ser_binary import ensure_built
 
-def parse_time_output(stderr_output):
-    """Parse time command output to extract user and sys time."""
-    lines = stderr_output.strip().split('\n')
-    user_time = sys_time = 0.0
-    for line in lines:
-        if 'user' in line:
-            m = re.search(r'(\d+)m([\d.]+)s', line)
-            if m:
-                user_time = int(m.group(1)) * 60 + float(m.group(2))
-            else:
-                m = re.search(r'([\d.]+)', line)
-                if m:
-                    user_time = float(m.group(1))
-        elif 'sys' in line:
-            m = re.search(r'(\d+)m([\d.]+)s', line)
-            if m:
-                sys_time = int(m.group(1)) * 60 + float(m.group(2))
-            else:
-                m = re.search(r'([\d.]+)', line)
-                if m:
-                    sys_time = float(m.group(1))
-    return user_time + sys_time
+# Every marker the classifier below looks at, matched in one scan of the output
+_STATUS_RE = re.compile('|'.join(map(re.escape, [
+    '✅ RESULT: SERIALIZABLE',
+    '❌ RESULT: NOT SERIALIZABLE',
+    '⏱️ RESULT: TIMEOUT',
+    '✅ Proof certificate is VALID',
+    '❌ Proof certificate is INVALID',
+    '✅ PROOF CERTIFICATE FOUND',
+    '✅ Trace is valid!',
+    '❌ Trace is INVALID!',
+    '❌ COUNTEREXAMPLE TRACE FOUND',
+    'SMPT timeout:',
+    'Analysis timed out',
+    'Number of components in semilinear set is too large',
+])))
+_TIMEOUT_MARKERS = {
+    'SMPT timeout:',
+    'Analysis timed out',
+    '⏱️ RESULT: TIMEOUT',
+    'Number of components in semilinear set is too large',
+}
+
+# Optimizations that can be switched off, in the order their flags are passed
+OPT_ORDER = ('bi', 'rr', 'gl', 'sk')
+OPT_FLAGS = {
+    'bi': '--without-bidirectional',
+    'rr': '--without-remove-redundant',
+    'gl': '--without-generate-less',
+    'sk': '--without-smart-kleene-order',
+}
+
+# --full-optimization-study passes: (report suffix, title, disabled optimizations)
+STUDY_CONFIGS = [
+    ('_no_optimizations', 'All optimizations disabled', {'bi', 'rr', 'gl', 'sk'}),
+    ('_all_optimizations', 'All optimizations enabled', set()),
+    ('_only_bidirectional', 'Only bidirectional pruning', {'rr', 'gl', 'sk'}),
+    ('_only_remove_redundant', 'Only remove redundant', {'bi', 'gl', 'sk'}),
+    ('_only_generate_less', 'Only generate less', {'bi', 'rr', 'sk'}),
+    ('_only_smart_kleene', 'Only smart Kleene order', {'bi', 'rr', 'gl'}),
+]
 
+# Results of earlier runs, keyed by _memo_key(); only used with --reuse-results,
+# which loads it from and saves it to RESULT_CACHE_PATH
+_RESULT_MEMO = {}
+RESULT_CACHE_PATH = 'out/.analysis_cache.json'
 
-def run_single_analysis(file_path, timeout_arg, extra_flags, use_cache=False):
+
+@dataclass(slots=True)
+class AnalysisResult:
+    """Outcome of one checker run on one example."""
+    status: str
+    original_result: str
+    proof_result: str
+    trace_valid: Optional[bool]
+    proof_verification: Optional[bool]
+    cpu_time: float
+    is_timeout: bool
+    filename: str = ''
+    duration: str = ''
+    index: int = 0
+
+
+def _memo_key(binary, file_path, timeout_arg, extra_flags, use_cache):
+    """Identify a run by input path and contents, binary build and options."""
+    digest = hashlib.sha1(Path(file_path).read_bytes()).hexdigest()
+    binary_mtime = Path(binary).stat().st_mtime_ns
+    return f"{file_path}|{digest}|{binary_mtime}|{timeout_arg}|{use_cache}|" + '\x1f'.join(extra_flags)
+
+
+def load_result_cache():
+    """Seed the memo with results saved by an earlier --reuse-results run."""
+    try:
+        with open(RESULT_CACHE_PATH) as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return
+    _RESULT_MEMO.update((k, AnalysisResult(**v)) for k, v in saved.items())
+
+
+def save_result_cache():
+    """Persist the memo so the next --reuse-results run can skip unchanged files."""
+    os.makedirs(os.path.dirname(RESULT_CACHE_PATH), exist_ok=True)
+    tmp = RESULT_CACHE_PATH + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump({k: asdict(v) for k, v in _RESULT_MEMO.items()}, f)
+    os.replace(tmp, RESULT_CACHE_PATH)
+
+
+def run_single_analysis(binary, file_path, timeout_arg, extra_flags, use_cache=False):
     """Run a single optimized analysis with optional extra flags."""
-    cmd = ['cargo', 'run', '--quiet', '--'] + extra_flags
+    cmd = [str(binary)] + extra_flags
     if timeout_arg:
         cmd += ['--timeout', str(timeout_arg)]
     if use_cache:
         cmd.append('--use-cache')
     cmd.append(str(file_path))
 
-    time_cmd = ['time'] + cmd
-    start = time.time()
+    # Each pool worker runs one subprocess at a time, so the RUSAGE_CHILDREN
+    # delta is exactly the CPU time of this run
+    before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    start = time.perf_counter_ns()
+    # Stream the output and keep only the markers the classifier needs, so
+    # memory stays bounded however chatty the checker is. The checker gets its
+    # own process group so a timeout also kills any solver it spawned, which
+    # would otherwise keep the pipe open.
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        start_new_session=True
+    )
+
+    def kill_group():
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    expired = threading.Event()
+    killer = None
+    if timeout_arg:
+        def expire():
+            expired.set()
+            kill_group()
+        killer = threading.Timer(timeout_arg * 2, expire)
+        killer.start()
+    seen = set()
     try:
-        result = subprocess.run(
-            time_cmd,
-            capture_output=True,
-            text=True,
-            timeout=(timeout_arg * 2) if timeout_arg else None
+        for line in proc.stdout:
+            seen.update(m.group() for m in _STATUS_RE.finditer(line))
+        returncode = proc.wait()
+    except BaseException:
+        # e.g. Ctrl-C: the checker is outside the terminal's process group
+        kill_group()
+        raise
+    finally:
+        if killer:
+            killer.cancel()
+        proc.stdout.close()
+
+    if expired.is_set():
+        return AnalysisResult(
+            status='⏱️ SMPT Timeout',
+            original_result='SMPT Timeout',
+            proof_result='SMPT Timeout',
+            trace_valid=None,
+            proof_verification=None,
+            cpu_time=0.0,
+            is_timeout=True
         )
-    except subprocess.TimeoutExpired:
-        return {
-            'status': '⏱️ SMPT Timeout',
-            'original_result': 'SMPT Timeout',
-            'proof_result': 'SMPT Timeout',
-            'trace_valid': None,
-            'proof_verification': None,
-            'cpu_time': 0.0,
-            'is_timeout': True
-        }
-
-    cpu = parse_time_output(result.stderr)
+
+    after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu = (after.ru_utime + after.ru_stime) - (before.ru_utime + before.ru_stime)
     if cpu == 0.0:
-        cpu = time.time() - start
+        cpu = (time.perf_counter_ns() - start) / 1e9
 
-    out = result.stdout + result.stderr
-    timeout_flag = 'SMPT timeout:' in out or 'Analysis timed out' in out or '⏱️ RESULT: TIMEOUT' in out or 'Number of components in semilinear set is too large' in out
+    timeout_flag = not _TIMEOUT_MARKERS.isdisjoint(seen)
 
     orig = 'Unknown'
     proof = 'Unknown'
     trace_valid = None
     proof_valid = None
-    if result.returncode == 0:
+    if returncode == 0:
         # Check for the new output format
-        if '✅ RESULT: SERIALIZABLE' in out:
+        if '✅ RESULT: SERIALIZABLE' in seen:
             orig = 'Serializable'
             proof = 'Serializable'
             # Check for proof certificate validity
-            if '✅ Proof certificate is VALID' in out:
+            if '✅ Proof certificate is VALID' in seen:
                 proof_valid = True
-            elif '❌ Proof certificate is INVALID' in out:
+            elif '❌ Proof certificate is INVALID' in seen:
                 proof_valid = False
-            elif '✅ PROOF CERTIFICATE FOUND' in out:
+            elif '✅ PROOF CERTIFICATE FOUND' in seen:
                 proof_valid = True
-        elif '❌ RESULT: NOT SERIALIZABLE' in out:
+        elif '❌ RESULT: NOT SERIALIZABLE' in seen:
             orig = 'Not serializable'
             proof = 'Not serializable'
             # Check for trace validity
-            if '✅ Trace is valid!' in out:
+            if '✅ Trace is valid!' in seen:
                 trace_valid = True
-            elif '❌ Trace is INVALID!' in out:
+            elif '❌ Trace is INVALID!' in seen:
                 trace_valid = False
-            elif '❌ COUNTEREXAMPLE TRACE FOUND' in out:
+            elif '❌ COUNTEREXAMPLE TRACE FOUND' in seen:
                 trace_valid = True
-        elif '⏱️ RESULT: TIMEOUT' in out:
+        elif '⏱️ RESULT: TIMEOUT' in seen:
             orig = 'SMPT Timeout'
             proof = 'SMPT Timeout'
     else:
@@ -124,49 +234,68 @@ def run_single_analysis(file_path, timeout_arg, extra_flags, use_cache=False):
     else:
         status = '⚠️ Error'
 
-    return {
-        'status': status,
-        'original_result': orig,
-        'proof_result': proof,
-        'trace_valid': trace_valid,
-        'proof_verification': proof_valid,
-        'cpu_time': cpu,
-        'is_timeout': timeout_flag
-    }
+    return AnalysisResult(
+        status=status,
+        original_result=orig,
+        proof_result=proof,
+        trace_valid=trace_valid,
+        proof_verification=proof_valid,
+        cpu_time=cpu,
+        is_timeout=timeout_flag
+    )
 
 
-def analyze_file(fp, timeout, idx, extra_flags, use_cache):
+def analyze_file(binary, fp, timeout, idx, extra_flags, use_cache):
+    """Analyze one file; progress lines are returned for the parent to print."""
     name = Path(fp).stem
-    print(f"[{idx}] `{name}`: Running optimized analysis...")
-    res = run_single_analysis(fp, timeout, extra_flags, use_cache)
-    dur = f"{res['cpu_time']:.2f}"
-    print(f"[{idx}] `{name}`: {res['status']} ({dur}s CPU)")
-    res.update({'filename': name, 'duration': dur, 'index': idx})
-    return res
+    res = run_single_analysis(binary, fp, timeout, extra_flags, use_cache)
+    dur = f"{res.cpu_time:.2f}"
+    res.filename, res.duration, res.index = name, dur, idx
+    log = (f"[{idx}] `{name}`: Running optimized analysis...\n"
+           f"[{idx}] `{name}`: {res.status} ({dur}s CPU)\n")
+    return res, log
 
 
-def run_analysis(files, timeout, jobs, cache, extras, suffix=""):
-    """Run analysis on files with given options."""
+def run_analysis(binary, files, timeout, jobs, cache, extras, suffix="", reuse=False):
+    """Run analysis on files with given options; with reuse, skip files the result memo already answers."""
     print(f"🔍 Analyzing (.ser & .json) with {jobs} jobs, timeout={timeout or 'none'}, "
           f"cache={'on' if cache else 'off'}, extras={extras}")
     print(f"Found {len(files)} examples")
 
     results = []
-    with ThreadPoolExecutor(max_workers=jobs) as ex:
-        futures = {ex.submit(analyze_file, fp, timeout, i, extras, cache): i for i, fp in enumerate(files)}
+    pending = []
+    for i, fp in enumerate(files):
+        # Keys hash each input file, so only build them when the memo can be consulted
+        key = _memo_key(binary, fp, timeout, extras, cache) if reuse else None
+        hit = _RESULT_MEMO.get(key) if reuse else None
+        if hit is None:
+            pending.append((i, fp, key))
+        else:
+            print(f"[{i}] `{hit.filename}`: {hit.status} ({hit.duration}s CPU, memoized)")
+            results.append(replace(hit, index=i))
+
+    # Processes rather than threads, so the per-file output parsing scales across cores
+    with ProcessPoolExecutor(max_workers=jobs) as ex:
+        futures = {ex.submit(analyze_file, binary, fp, timeout, i, extras, cache): key for i, fp, key in pending}
+        # Workers don't print; the parent writes each file's lines in one go
         for fut in as_completed(futures):
-            results.append(fut.result())
-    results.sort(key=lambda r: r['index'])
+            res, log = fut.result()
+            sys.stdout.write(log)
+            # Only definite answers are reused; errors and timeouts get retried
+            if reuse and res.status in ('✅ Serializable', '❌ Not serializable'):
+                _RESULT_MEMO[futures[fut]] = res
+            results.append(res)
+    results.sort(key=lambda r: r.index)
 
     # Print non-validated cases
-    nv_proofs = [r['filename'] for r in results
-                 if r['original_result'] == 'Serializable'
-                 and r['proof_result'] == 'Serializable'
-                 and r['proof_verification'] is False]
-    nv_traces = [r['filename'] for r in results
-                 if r['original_result'] == 'Not serializable'
-                 and r['proof_result'] == 'Not serializable'
-                 and r['trace_valid'] is False]
+    nv_proofs = [r.filename for r in results
+                 if r.original_result == 'Serializable'
+                 and r.proof_result == 'Serializable'
+                 and r.proof_verification is False]
+    nv_traces = [r.filename for r in results
+                 if r.original_result == 'Not serializable'
+                 and r.proof_result == 'Not serializable'
+                 and r.trace_valid is False]
     if nv_proofs:
         print('❌ Non-validated proofs for:', ', '.join(nv_proofs))
     if nv_traces:
@@ -175,43 +304,46 @@ def run_analysis(files, timeout, jobs, cache, extras, suffix=""):
     # Ensure out directory exists
     os.makedirs('out', exist_ok=True)
     out_md = f'out/serializability_report{suffix}.md'
-    with open(out_md, 'w') as f:
+    # Write next to the target and swap it in, so an interrupted run never
+    # leaves a truncated report behind
+    tmp_md = out_md + '.tmp'
+    with open(tmp_md, 'w', buffering=1 << 20) as f:
         f.write(f"# Serializability Analysis Report{' - ' + suffix.title() if suffix else ''}\n"
                 f"Generated: {datetime.now():%Y-%m-%d %H:%M:%S}\n"
                 f"Extras: {extras}\n\n")
         f.write("|Example|Result|CPU(s)|Valid?|\n|--|--|--|--|\n")
         for r in results:
             # Determine validation status
-            if r['original_result'] == 'Serializable':
-                valid = 'N/A' if r['proof_verification'] is None else ('✅' if r['proof_verification'] else '❌')
-            elif r['original_result'] == 'Not serializable':
-                valid = 'N/A' if r['trace_valid'] is None else ('✅' if r['trace_valid'] else '❌')
+            if r.original_result == 'Serializable':
+                valid = 'N/A' if r.proof_verification is None else ('✅' if r.proof_verification else '❌')
+            elif r.original_result == 'Not serializable':
+                valid = 'N/A' if r.trace_valid is None else ('✅' if r.trace_valid else '❌')
             else:
                 valid = 'N/A'
             # wrap filename in backticks for nicer Markdown
-            f.write(f"| `{r['filename']}` |{r['original_result']}|{r['duration']}|{valid}|\n")
-
-        # summary counts
-        s_cnt = sum(r['original_result'] == 'Serializable' and r['proof_result'] == 'Serializable'
-                    for r in results)
-        vp = sum(r['proof_verification'] == True
-                 for r in results
-                 if r['original_result'] == 'Serializable'
-                 and r['proof_result'] == 'Serializable')
+            f.write(f"| `{r.filename}` |{r.original_result}|{r.duration}|{valid}|\n")
+
+        # summary counts, gathered in one pass
+        s_cnt = vp = ns_cnt = vt = to_cnt = err = 0
+        for r in results:
+            o, p = r.original_result, r.proof_result
+            if o == 'Serializable' and p == 'Serializable':
+                s_cnt += 1
+                vp += r.proof_verification == True
+            elif o == 'Not serializable' and p == 'Not serializable':
+                ns_cnt += 1
+                vt += r.trace_valid == True
+            if r.status == '⏱️ SMPT Timeout':
+                to_cnt += 1
+            elif r.status == '⚠️ Error':
+                err += 1
         ip = s_cnt - vp
-        ns_cnt = sum(r['original_result'] == 'Not serializable' and r['proof_result'] == 'Not serializable'
-                     for r in results)
-        vt = sum(r['trace_valid'] == True
-                 for r in results
-                 if r['original_result'] == 'Not serializable'
-                 and r['proof_result'] == 'Not serializable')
         it = ns_cnt - vt
-        to_cnt = sum(r['status'] == '⏱️ SMPT Timeout' for r in results)
-        err = sum(r['status'] == '⚠️ Error' for r in results)
         f.write("\n## Summary\n")
         f.write(f"- Serializable: {s_cnt} (valid proofs: {vp}, invalid: {ip})\n")
         f.write(f"- Not serializable: {ns_cnt} (valid traces: {vt}, invalid: {it})\n")
         f.write(f"- Timeouts: {to_cnt}, Errors: {err}, Total: {len(results)}\n")
+    os.replace(tmp_md, out_md)
 
     print(f"✅ Done. Report: {out_md}")
 
@@ -231,6 +363,9 @@ def main():
                         help='Disable bidirectional optimization')  # <— new
     parser.add_argument('--no-viz', action='store_true', help='Disable visualization generation')
     parser.add_argument('--path', type=str, help='Specific file or directory to analyze')
+    parser.add_argument('--reuse-results', action='store_true',
+                        help=f'Reuse serializable/not-serializable results of unchanged files '
+                             f'across runs (stored in {RESULT_CACHE_PATH})')
     parser.add_argument('--all-optimizations', action='store_true', 
                         help='Run with all optimizations enabled (default)')
     parser.add_argument('--no-optimizations', action='store_true',
@@ -242,7 +377,13 @@ def main():
     known_args, extra = parser.parse_known_args()
 
     timeout = known_args.timeout
-    jobs = known_args.jobs or os.cpu_count() or 4
+    # The binary is built before any job starts, so workers never compete with
+    # cargo; size the pool by the CPUs this process may actually run on
+    if hasattr(os, 'sched_getaffinity'):
+        available_cpus = len(os.sched_getaffinity(0))
+    else:
+        available_cpus = os.cpu_count()
+    jobs = known_args.jobs or available_cpus or 4
     cache = known_args.use_cache
     
     # Get files list
@@ -256,10 +397,7 @@ def main():
                 parser.error(f"Unsupported file type: {path.suffix}. Only .ser and .json files are supported.")
         elif path.is_dir():
             # Directory - recursively find all .ser and .json files
-            files = sorted(
-                list(path.rglob('*.ser')) + 
-                list(path.rglob('*.json'))
-            )
+            files = sorted(p for p in path.rglob('*') if p.suffix in ('.ser', '.json'))
             if not files:
                 parser.error(f"No .ser or .json files found in directory: {path}")
         else:
@@ -274,68 +412,31 @@ def main():
     # Check for conflicting options
     if known_args.all_optimizations and known_args.no_optimizations:
         parser.error("Cannot use --all-optimizations and --no-optimizations together")
+
+    # Build once; every run then invokes the binary without cargo's per-call checks
+    binary = ensure_built()
+
+    if known_args.reuse_results:
+        load_result_cache()
+        atexit.register(save_result_cache)
     
     # Handle full optimization study mode
     if known_args.full_optimization_study:
         print("🔬 Running full optimization study (6 configurations)...")
         
-        # 1. No optimizations
-        print("\n📊 Configuration 1/6: All optimizations disabled")
-        extras_noopt = ['--without-bidirectional', '--without-remove-redundant', 
-                        '--without-generate-less', '--without-smart-kleene-order']
-        if known_args.no_viz:
-            extras_noopt.append('--no-viz')
-        extras_noopt.extend(extra)
-        run_analysis(files, timeout, jobs, cache, extras_noopt, "_no_optimizations")
-        
-        # 2. All optimizations
-        print("\n📊 Configuration 2/6: All optimizations enabled")
-        extras_all = []
-        if known_args.no_viz:
-            extras_all.append('--no-viz')
-        extras_all.extend(extra)
-        run_analysis(files, timeout, jobs, cache, extras_all, "_all_optimizations")
-        
-        # 3. Only bidirectional pruning
-        print("\n📊 Configuration 3/6: Only bidirectional pruning")
-        extras_b = ['--without-remove-redundant', '--without-generate-less', '--without-smart-kleene-order']
-        if known_args.no_viz:
-            extras_b.append('--no-viz')
-        extras_b.extend(extra)
-        run_analysis(files, timeout, jobs, cache, extras_b, "_only_bidirectional")
-        
-        # 4. Only remove redundant
-        print("\n📊 Configuration 4/6: Only remove redundant")
-        extras_r = ['--without-bidirectional', '--without-generate-less', '--without-smart-kleene-order']
-        if known_args.no_viz:
-            extras_r.append('--no-viz')
-        extras_r.extend(extra)
-        run_analysis(files, timeout, jobs, cache, extras_r, "_only_remove_redundant")
-        
-        # 5. Only generate less
-        print("\n📊 Configuration 5/6: Only generate less")
-        extras_g = ['--without-bidirectional', '--without-remove-redundant', '--without-smart-kleene-order']
-        if known_args.no_viz:
-            extras_g.append('--no-viz')
-        extras_g.extend(extra)
-        run_analysis(files, timeout, jobs, cache, extras_g, "_only_generate_less")
-        
-        # 6. Only smart Kleene order
-        print("\n📊 Configuration 6/6: Only smart Kleene order")
-        extras_s = ['--without-bidirectional', '--without-remove-redundant', '--without-generate-less']
-        if known_args.no_viz:
-            extras_s.append('--no-viz')
-        extras_s.extend(extra)
-        run_analysis(files, timeout, jobs, cache, extras_s, "_only_smart_kleene")
+        for n, (suffix, title, disabled) in enumerate(STUDY_CONFIGS, 1):
+            print(f"\n📊 Configuration {n}/{len(STUDY_CONFIGS)}: {title}")
+            extras_cfg = [OPT_FLAGS[o] for o in OPT_ORDER if o in disabled]
+            if known_args.no_viz:
+                extras_cfg.append('--no-viz')
+            extras_cfg.extend(extra)
+            run_analysis(binary, files, timeout, jobs, cache, extras_cfg, suffix,
+                         known_args.reuse_results)
         
         print("\n✅ Full optimization study complete!")
         print("📋 Generated reports:")
-        print("  - out/serializability_report_no_optimizations.md")
-        print("  - out/serializability_report_all_optimizations.md")
-        print("  - out/serializability_report_only_bidirectional.md")
-        print("  - out/serializability_report_only_remove_redundant.md")
-        print("  - out/serializability_report_only_generate_less.md")
-        print("  - out/serializability_report_only_smart_kleene.md")
+        for suffix, _, _ in STUDY_CONFIGS:
+            print(f"  - out/serializability_report{suffix}.md")
         return
     
     # Handle optimization comparison mode
@@ -347,7 +448,8 @@ def main():
         if known_args.no_viz:
             extras_opt.append('--no-viz')
         extras_opt.extend(extra)
-        run_analysis(files, timeout, jobs, cache, extras_opt, "_optimized")
+        run_analysis(binary, files, timeout, jobs, cache, extras_opt, "_optimized",
+                     known_args.reuse_results)
         
         # Second run without optimizations
         print("\n📊 Pass 2: With all optimizations disabled")
@@ -356,7 +458,8 @@ def main():
         if known_args.no_viz:
             extras_noopt.append('--no-viz')
         extras_noopt.extend(extra)
-        run_analysis(files, timeout, jobs, cache, extras_noopt, "_unoptimized")
+        run_analysis(binary, files, timeout, jobs, cache, extras_noopt, "_unoptimized",
+                     known_args.reuse_results)
         
         print("\n✅ Optimization comparison complete!")
         return
@@ -384,7 +487,8 @@ def main():
     # append other unknown flags
     extras.extend(extra)
     
-    run_analysis(files, timeout, jobs, cache, extras)
+    run_analysis(binary, files, timeout, jobs, cache, extras,
+                 reuse=known_args.reuse_results)
 
 
 if __name__ == '__main__':
@@ -6,11 +6,13 @@ import re
 from pathlib import Path
 from collections import defaultdict
 
-def run_single_example(json_file, timeout=5):
+from _ser_binary import ensure_built
+
+def run_single_example(json_file, binary, timeout=5):
     """Run a single example with timeout"""
     try:
         result = subprocess.run(
-            ["cargo", "run", "--", json_file],
+            [str(binary), json_file],
             capture_output=True,
             text=True,
             timeout=timeout
@@ -88,6 +90,7 @@ def analyze_output(stdout, stderr):
 def main():
     json_dir = Path("examples/json/small")
     json_files = sorted(json_dir.glob("*.json"))
+    binary = ensure_built()
     
     issues_by_category = defaultdict(list)
     total_files = len(json_files)
@@ -99,7 +102,7 @@ def main():
         if (i + 1) % 10 == 0:
             print(f"Progress: {i+1}/{total_files} files analyzed...")
         
-        stdout, stderr, returncode = run_single_example(str(json_file))
+        stdout, stderr, returncode = run_single_example(str(json_file), binary)
         issue = analyze_output(stdout, stderr)
         
         issues_by_category[issue["category"]].append({
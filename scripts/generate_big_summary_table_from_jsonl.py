@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
-import json
+import argparse
 import csv
 import os
 
+from _jsonl_loader import load_records
+
 # Hard-coded paths
 INPUT_JSONL = "out/serializability_stats.jsonl"
 SUMMARY_CSV = "out/jsonl_summarizing_table.csv"
@@ -22,6 +24,11 @@ SYMBOLS = {
 # when a timeout occurs, override based on these sets
 HARD_SERIALIZABLE = {"g2.ser"}
 HARD_NON_SERIALIZABLE = {"c1.ser", "e2.ser"}
+# symbol to show for each of the above when it timed out
+SYM_OVERRIDE = (
+    {bm: SYMBOLS["not_serializable"] for bm in HARD_NON_SERIALIZABLE}
+    | {bm: SYMBOLS["serializable"] for bm in HARD_SERIALIZABLE}
+)
 
 # categories and their benchmarks (in order)
 CATEGORIES = [
@@ -34,61 +41,94 @@ CATEGORIES = [
     ("Networking \\& system protocols", ["g1.ser","g2.ser","g3.ser","g4.ser","g5.ser","g6.ser","g7.ser"])
 ]
 
-# static features columns (six entries) for each benchmark
-FEATURES_COLS = {
-    "a1.ser":   "&  & \\cmark &  &  &       &  ",
-    "a2.ser":   "&  &        &  &  & \\cmark &  ",
-    "a3.ser":   "&  &        &  &  &       &  ",
-    "a4.ser":   "&  &        &  &  & \\cmark & \\cmark",
-    "a5.ser":   "&  & \\cmark &  &  & \\cmark & \\cmark",
-    "a6.ser":   "&  &        &  &  & \\cmark & \\cmark",
-    "a7.ser":   "& \\cmark & \\cmark &  &  & \\cmark &  ",
-    "b1.json":  "& \\cmark &        &  &  & \\cmark & \\cmark",
-    "b2.json":  "& \\cmark &        &  &  & \\cmark & \\cmark",
-    "b3.json":  "& \\cmark &        &  &  & \\cmark & \\cmark",
-    "b4.json":  "& \\cmark &        &  &  & \\cmark & \\cmark",
-    "c1.ser":   "&  & \\cmark &  & \\cmark & \\cmark & \\cmark",
-    "c2.ser":   "&  & \\cmark &  & \\cmark & \\cmark & \\cmark",
-    "c3.ser":   "&  & \\cmark &  & \\cmark & \\cmark & \\cmark",
-    "c4.ser":   "&  & \\cmark &  & \\cmark & \\cmark & \\cmark",
-    "c5.ser":   "&  & \\cmark &  & \\cmark & \\cmark & \\cmark",
-    "c6.ser":   "&  & \\cmark &  & \\cmark & \\cmark & \\cmark",
-    "c7.ser":   "&  & \\cmark &  & \\cmark & \\cmark & \\cmark",
-    "c8.ser":   "&  & \\cmark &  & \\cmark & \\cmark & \\cmark",
-    "d1.ser":   "& \\cmark & \\cmark & \\cmark &  & \\cmark &  ",
-    "d2.ser":   "& \\cmark &        & \\cmark &  &   \\cmark &  ",
-    "d3.ser":   "& \\cmark & \\cmark & \\cmark &  &  \\cmark &  ",
-    "d4.ser":   "& \\cmark & \\cmark & \\cmark &  &     \\cmark &  ",
-    "d5.ser":   "& \\cmark &        &  &  & \\cmark &  ",
-    "e1.ser":   "&  & \\cmark &  &  & \\cmark &  ",
-    "e2.ser":   "& \\cmark & \\cmark &  & \\cmark & \\cmark & \\cmark",
-    "e3.ser":   "& \\cmark & \\cmark &  & \\cmark &   \\cmark & \\cmark",
-    "e4.ser":   "& \\cmark & \\cmark &  &  \\cmark &   \\cmark & \\cmark",
-    "e5.ser":   "& \\cmark & \\cmark & \\cmark &  & \\cmark &  ",
-    "e6.ser":   "& \\cmark & \\cmark & \\cmark &  & \\cmark &  ",
-    "e7.ser":   "&  & \\cmark &  &  &   \\cmark &  ",
-    "f1.ser":   "& \\cmark &    \\cmark    & \\cmark &  & \\cmark &  ",
-    "f2.ser":   "& \\cmark &   \\cmark     & \\cmark &  & \\cmark &  ",
-    "f3.ser":   "&  &        &  & \\cmark &   \\cmark & \\cmark",
-    "f4.ser":   "&  &     \\cmark   &  & \\cmark & \\cmark & \\cmark",
-    "f5.ser":   "& \\cmark &        & \\cmark &  &       &  ",
-    "f6.ser":   "& \\cmark &        & \\cmark &  & \\cmark &  ",
-    "f7.ser":   "& \\cmark &        & \\cmark &  &  \\cmark &  ",
-    "f8.ser":   "& \\cmark &        & \\cmark &  &   \\cmark &  ",
-    "f9.ser":   "& \\cmark &        & \\cmark &  &  \\cmark &  ",
-    "g1.ser":   "& \\cmark & \\cmark &  & \\cmark & \\cmark & \\cmark",
-    "g2.ser":   "& \\cmark & \\cmark &  & \\cmark & \\cmark & \\cmark",
-    "g3.ser":   "& \\cmark & \\cmark & \\cmark & \\cmark & \\cmark & \\cmark",
-    "g4.ser":   "& \\cmark & \\cmark & \\cmark & \\cmark & \\cmark & \\cmark",
-    "g5.ser":   "& \\cmark & \\cmark & \\cmark & \\cmark &   \\cmark & \\cmark",
-    "g6.ser":   "& \\cmark &        & \\cmark & \\cmark & \\cmark &  ",
-    "g7.ser":   "& \\cmark &        & \\cmark & \\cmark &       &  ",
+# static feature marks for each benchmark, one character per column
+# (If, While, ?, Arith, Yield, Multi-req): "x" = \cmark, "." = empty
+FEATURE_MARKS = {
+    "a1.ser":  ".x....",
+    "a2.ser":  "....x.",
+    "a3.ser":  "......",
+    "a4.ser":  "....xx",
+    "a5.ser":  ".x..xx",
+    "a6.ser":  "....xx",
+    "a7.ser":  "xx..x.",
+    "b1.json": "x...xx",
+    "b2.json": "x...xx",
+    "b3.json": "x...xx",
+    "b4.json": "x...xx",
+    "c1.ser":  ".x.xxx",
+    "c2.ser":  ".x.xxx",
+    "c3.ser":  ".x.xxx",
+    "c4.ser":  ".x.xxx",
+    "c5.ser":  ".x.xxx",
+    "c6.ser":  ".x.xxx",
+    "c7.ser":  ".x.xxx",
+    "c8.ser":  ".x.xxx",
+    "d1.ser":  "xxx.x.",
+    "d2.ser":  "x.x.x.",
+    "d3.ser":  "xxx.x.",
+    "d4.ser":  "xxx.x.",
+    "d5.ser":  "x...x.",
+    "e1.ser":  ".x..x.",
+    "e2.ser":  "xx.xxx",
+    "e3.ser":  "xx.xxx",
+    "e4.ser":  "xx.xxx",
+    "e5.ser":  "xxx.x.",
+    "e6.ser":  "xxx.x.",
+    "e7.ser":  ".x..x.",
+    "f1.ser":  "xxx.x.",
+    "f2.ser":  "xxx.x.",
+    "f3.ser":  "...xxx",
+    "f4.ser":  ".x.xxx",
+    "f5.ser":  "x.x...",
+    "f6.ser":  "x.x.x.",
+    "f7.ser":  "x.x.x.",
+    "f8.ser":  "x.x.x.",
+    "f9.ser":  "x.x.x.",
+    "g1.ser":  "xx.xxx",
+    "g2.ser":  "xx.xxx",
+    "g3.ser":  "xxxxxx",
+    "g4.ser":  "xxxxxx",
+    "g5.ser":  "xxxxxx",
+    "g6.ser":  "x.xxx.",
+    "g7.ser":  "x.xx..",
+}
+
+# many benchmarks share a feature pattern; build each distinct cell string once
+# and let the benchmarks reference it
+_FEAT = {
+    marks: "& " + " & ".join("\\cmark" if m == "x" else "" for m in marks)
+    for marks in set(FEATURE_MARKS.values())
 }
+FEATURES_COLS = {bm: _FEAT[marks] for bm, marks in FEATURE_MARKS.items()}
 
-def summarize_jsonl_to_csv(input_path, output_path):
-    """Read JSONL and write benchmark summary CSV."""
+# per-benchmark row skeletons; only the symbol and timings vary at emit time
+ROW_TEMPLATES = {
+    bm: f" & \\texttt{{{{{bm}}}}} & {{sym}} {feats} & {{cert}} & {{total}} \\\\\n"
+    for bm, feats in FEATURES_COLS.items()
+}
+MULTIROW_PREFIXES = {
+    cat: f"\t\t\\multirow{{{len(benches)}}}{{=}}{{{cat}}}"
+    for cat, benches in CATEGORIES
+}
+
+def build_summary(input_path):
+    """Read JSONL once into CSV rows and a dict bench→(res, cert, total)."""
+    rows = []
+    summary = {}
+    for rec in load_records(input_path):
+        bm = os.path.basename(rec.get("example", ""))
+        res = rec.get("result", "")
+        cert = rec.get("certificate_creation_time_ms", "")
+        total = rec.get("total_time_ms", "")
+        rows.append([bm, res, cert, total])
+        # same strings the table used to get back from reading the CSV
+        summary[bm] = tuple("" if v is None else str(v) for v in (res, cert, total))
+    return rows, summary
+
+def write_summary_csv(rows, output_path):
+    """Write benchmark summary CSV (consumed by generate_stats_table_for_big_table.py)."""
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(input_path) as jf, open(output_path, "w", newline="") as cf:
+    with open(output_path, "w", newline="") as cf:
         writer = csv.writer(cf)
         writer.writerow([
             "benchmark",
@@ -96,36 +136,13 @@ def summarize_jsonl_to_csv(input_path, output_path):
             "certificate running time",
             "total running time"
         ])
-        for line in jf:
-            if not line.strip():
-                continue
-            rec = json.loads(line)
-            bm = os.path.basename(rec.get("example", ""))
-            res = rec.get("result", "")
-            cert = rec.get("certificate_creation_time_ms", "")
-            total = rec.get("total_time_ms", "")
-            writer.writerow([bm, res, cert, total])
+        writer.writerows(rows)
     print(f"Wrote CSV summary to {output_path}")
 
-def load_summary(csv_path):
-    """Load CSV into dict bench→(res, cert, total)."""
-    summary = {}
-    with open(csv_path) as cf:
-        reader = csv.DictReader(cf)
-        for row in reader:
-            summary[row["benchmark"]] = (
-                row["result"],
-                row["certificate running time"],
-                row["total running time"]
-            )
-    return summary
-
 def generate_table(summary, out_path):
     """Write the LaTeX table using summary data and timeout logic."""
-    os.makedirs(os.path.dirname(out_path), exist_ok=True)
-    with open(out_path, "w") as tex:
-        # header
-        tex.write(r"""\begin{table}[H]
+    # header
+    parts = [r"""\begin{table}[H]
 	\centering
 	\small
 	% increase horizontal padding between columns
@@ -149,52 +166,55 @@ def generate_table(summary, out_path):
 		& If & While & \texttt{?} & Arith & Yield & Multi-req
 		& Cert. & Total \\
 		\midrule
-""")
-        # body
-        for cat, benches in CATEGORIES:
-            tex.write(f"\t\t\\multirow{{{len(benches)}}}{{=}}{{{cat}}}")
-            for i, bm in enumerate(benches):
-                res, cert, total = summary.get(bm, ("", "", ""))
-                # pick symbol, with override on timeout
-                if res == "timeout":
-                    if bm in HARD_SERIALIZABLE:
-                        sym = SYMBOLS["serializable"]
-                    elif bm in HARD_NON_SERIALIZABLE:
-                        sym = SYMBOLS["not_serializable"]
-                    else:
-                        sym = SYMBOLS["timeout"]
-                else:
-                    sym = SYMBOLS.get(res, "")
+"""]
+    # body
+    for cat, benches in CATEGORIES:
+        parts.append(MULTIROW_PREFIXES[cat])
+        for i, bm in enumerate(benches):
+            res, cert, total = summary.get(bm, ("", "", ""))
+            # pick symbol, with override on timeout
+            if res == "timeout":
+                sym = SYM_OVERRIDE.get(bm, SYMBOLS["timeout"])
+            else:
+                sym = SYMBOLS.get(res, "")
 
-                # timing display
-                if res == "timeout":
-                    cert_disp = r"\texttt{TIMEOUT}"
+            # timing display
+            if res == "timeout":
+                cert_disp = r"\texttt{TIMEOUT}"
+                total_disp = r"\texttt{TIMEOUT}"
+            else:
+                cert_disp = cert
+                try:
+                    total_ms = int(total)
+                except ValueError:
+                    total_ms = 0
+                if total_ms >= TIMEOUT_MS:
                     total_disp = r"\texttt{TIMEOUT}"
                 else:
-                    cert_disp = cert
-                    try:
-                        total_ms = int(total)
-                    except ValueError:
-                        total_ms = 0
-                    if total_ms >= TIMEOUT_MS:
-                        total_disp = r"\texttt{TIMEOUT}"
-                    else:
-                        total_disp = total
-
-                feats = FEATURES_COLS[bm]
-                prefix = "" if i == 0 else "\t\t"
-                tex.write(f"{prefix} & \\texttt{{{bm}}} & {sym} {feats} & {cert_disp} & {total_disp} \\\\\n")
-            tex.write("\t\t\\midrule\n")
-        # footer
-        tex.write(r"""\bottomrule
+                    total_disp = total
+
+            prefix = "" if i == 0 else "\t\t"
+            parts.append(prefix + ROW_TEMPLATES[bm].format(sym=sym, cert=cert_disp, total=total_disp))
+        parts.append("\t\t\\midrule\n")
+    # footer
+    parts.append(r"""\bottomrule
 	\end{tabular*}
 \end{table}
 """)
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    with open(out_path, "w") as tex:
+        tex.write("".join(parts))
     print(f"Wrote LaTeX table to {out_path}")
 
 def main():
-    summarize_jsonl_to_csv(INPUT_JSONL, SUMMARY_CSV)
-    summary = load_summary(SUMMARY_CSV)
+    parser = argparse.ArgumentParser(description="Generate the big LaTeX summary table from the stats JSONL")
+    parser.add_argument("--no-csv", action="store_true",
+                        help=f"Skip writing {SUMMARY_CSV} (needed only by generate_stats_table_for_big_table.py)")
+    args = parser.parse_args()
+
+    rows, summary = build_summary(INPUT_JSONL)
+    if not args.no_csv:
+        write_summary_csv(rows, SUMMARY_CSV)
     generate_table(summary, OUTPUT_TEX)
 
 if __name__ == "__main__":
@@ -3,34 +3,90 @@
 Generate LaTeX tables from serializability statistics
 """
 
-import json
 from pathlib import Path
 import argparse
+import os
 from collections import defaultdict
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List
+
+from _jsonl_loader import load_records
 
 # Try to import plotting libraries
 try:
     import matplotlib.pyplot as plt
     import numpy as np
     PLOTTING_AVAILABLE = True
+    # Whitegrid style under its current or pre-3.6 name; None falls back to the default style
+    CACTUS_STYLE = next((name for name in ('seaborn-v0_8-whitegrid', 'seaborn-whitegrid')
+                         if name in plt.style.available), None)
 except ImportError:
     PLOTTING_AVAILABLE = False
     print("Warning: matplotlib not available. Cactus plot generation will be skipped.")
 
 
 def load_stats(stats_file) -> List[Dict[str, Any]]:
-    """Load all statistics from JSONL file"""
-    stats = []
-    with open(stats_file, 'r') as f:
-        for line in f:
-            if line.strip():
-                stats.append(json.loads(line.strip()))
-    return stats
+    """Load all statistics from JSONL file (orjson over bytes, via the shared loader)"""
+    return load_records(stats_file)
+
+
+# The four optimization switches of a stat's options, as a (bid, rem, gen, smart) tuple
+OPTION_FLAGS = itemgetter('bidirectional_pruning', 'remove_redundant', 'generate_less', 'smart_kleene_order')
+
+# (bidirectional, remove_redundant, generate_less, smart_kleene) -> breakdown table column
+BREAKDOWN_KEYS = {
+    (False, False, False, False): 'none',
+    (True, True, True, True): 'all',
+    (True, False, False, False): 'bidirectional',
+    (False, True, False, False): 'remove_redundant',
+    (False, False, True, False): 'generate_less',
+    (False, False, False, True): 'smart_kleene',
+}
+
+
+@lru_cache(maxsize=None)
+def example_stem(example):
+    """Example name without directory or extension (memoized: each example has several runs)"""
+    return os.path.splitext(os.path.basename(example))[0]
+
+
+def index_stats(stats: List[Dict[str, Any]]):
+    """Single pass over stats building the views the per-table generators need:
+    the all-optimizations runs, example -> {'optimized'|'unoptimized': stat} for the
+    timing table, and example -> {breakdown key: stat} for the breakdown table."""
+    opt_stats = []
+    by_example_timing = defaultdict(dict)
+    by_example_breakdown = defaultdict(dict)
+
+    for stat in stats:
+        example_name = example_stem(stat['example'])
+        flags = OPTION_FLAGS(stat['options'])
 
+        if all(flags):
+            opt_stats.append(stat)
+            by_example_timing[example_name]['optimized'] = stat
+        else:
+            by_example_timing[example_name]['unoptimized'] = stat
+
+        opts_key = BREAKDOWN_KEYS.get(flags)
+        if opts_key is not None:  # Skip mixed configurations
+            by_example_breakdown[example_name][opts_key] = stat
+
+    return opt_stats, by_example_timing, by_example_breakdown
+
+
+# Row templates for the two tables that get a line per run/disjunct
+# (Example, Opts, Result, Disj., SL, PN places/transitions, Pruned, Time, SMPT calls/timeouts)
+COMPREHENSIVE_ROW = "\\texttt{%s} & %s & %s & %s & %s & %s/%s & %.0f\\%% & %s & %s/%s \\\\\n"
+# (Example, Disj., Places before/after, Transitions before/after, Iter., Reduction)
+PRUNING_ROW = "\\texttt{%s} & %s & %s → %s & %s → %s & %s & %.1f\\%% \\\\\n"
 
+
+@lru_cache(maxsize=2048)
 def format_time(ms):
-    """Format milliseconds to a nice string"""
+    """Format milliseconds to a nice string (memoized: the same durations recur across rows and tables)"""
     if ms is None:
         return "N/A"
     if ms < 1000:
@@ -41,123 +97,110 @@ def format_time(ms):
 
 def generate_comprehensive_table(stats: List[Dict[str, Any]]) -> str:
     """Generate comprehensive statistics table"""
-    # Group by example and optimization settings
-    grouped = defaultdict(list)
+    # Group by example and optimization settings, keeping the first run per configuration
+    grouped = {}
     for stat in stats:
-        key = (stat['example'],
-               stat['options']['bidirectional_pruning'],
-               stat['options']['remove_redundant'],
-               stat['options']['generate_less'],
-               stat['options']['smart_kleene_order'])
-        grouped[key].append(stat)
+        key = (stat['example'], *OPTION_FLAGS(stat['options']))
+        if key not in grouped:
+            grouped[key] = stat
 
     rows = []
-    for (example, bid, rem, gen, smart), group in sorted(grouped.items()):
-        row = group[0]  # Assuming one run per configuration
+    for (example, bid, rem, gen, smart), row in sorted(grouped.items()):
 
-        # Extract base name without extension
-        example_name = Path(example).stem
+        # Base name without extension
+        example_name = example_stem(example)
 
         # Format optimization flags as a compact string
         opts = f"{'B' if bid else '-'}{'R' if rem else '-'}{'G' if gen else '-'}{'S' if smart else '-'}"
 
         # Calculate pruning effectiveness
-        total_places_removed = sum(d['removed_places'] for d in row['petri_net']['disjuncts'])
-        total_trans_removed = sum(d['removed_transitions'] for d in row['petri_net']['disjuncts'])
+        pn = row['petri_net']
+        disjuncts = pn['disjuncts']
+        total_places_removed = sum(d['removed_places'] for d in disjuncts)
+        total_trans_removed = sum(d['removed_transitions'] for d in disjuncts)
 
-        places_before = row['petri_net']['places_before']
-        trans_before = row['petri_net']['transitions_before']
+        places_before = pn['places_before']
+        trans_before = pn['transitions_before']
 
         pruning_pct = 0
         if trans_before > 0:
             pruning_pct = (total_trans_removed / trans_before) * 100
 
-        rows.append({
-            'Example': f"\\texttt{{{example_name}}}",
-            'Opts': opts,
-            'Result': 'S' if row['result'] == 'serializable' else ('T' if row['result'] == 'timeout' else 'NS'),
-            'Disjuncts': str(row['num_disjuncts']),
-            'SL Size': str(row['semilinear_set']['num_components']),
-            'PN Size': f"{places_before}/{trans_before}",
-            'Pruned': f"{pruning_pct:.0f}\\%",
-            'Time': format_time(row['total_time_ms']),
-            'SMPT': f"{row['smpt_calls']}/{row['smpt_timeouts']}"
-        })
+        rows.append(COMPREHENSIVE_ROW % (
+            example_name,
+            opts,
+            'S' if row['result'] == 'serializable' else ('T' if row['result'] == 'timeout' else 'NS'),
+            row['num_disjuncts'],
+            row['semilinear_set']['num_components'],
+            places_before, trans_before,
+            pruning_pct,
+            format_time(row['total_time_ms']),
+            row['smpt_calls'], row['smpt_timeouts'],
+        ))
 
     # Convert to LaTeX
-    latex = "\\begin{tabular}{llccccccc}\n"
-    latex += "\\toprule\n"
-    latex += "Example & Opts & Result & Disj. & SL & PN & Pruned & Time & SMPT \\\\\n"
-    latex += "\\midrule\n"
-
-    for row in rows:
-        latex += " & ".join([row['Example'], row['Opts'], row['Result'], row['Disjuncts'],
-                           row['SL Size'], row['PN Size'], row['Pruned'], row['Time'], row['SMPT']]) + " \\\\\n"
+    parts = [
+        "\\begin{tabular}{llccccccc}\n",
+        "\\toprule\n",
+        "Example & Opts & Result & Disj. & SL & PN & Pruned & Time & SMPT \\\\\n",
+        "\\midrule\n",
+    ]
 
-    latex += "\\bottomrule\n"
-    latex += "\\end{tabular}\n"
-    latex += "\n% Legend: S = Serializable, NS = Not Serializable, T = Timeout\n"
-    latex += "% Opts: B = Bidirectional Pruning, R = Remove Redundant, G = Generate Less, S = Smart Kleene Order\n"
+    parts.extend(rows)
 
-    return latex
+    parts += [
+        "\\bottomrule\n",
+        "\\end{tabular}\n",
+        "\n% Legend: S = Serializable, NS = Not Serializable, T = Timeout\n",
+        "% Opts: B = Bidirectional Pruning, R = Remove Redundant, G = Generate Less, S = Smart Kleene Order\n",
+    ]
 
+    return "".join(parts)
 
-def generate_pruning_effectiveness_table(stats: List[Dict[str, Any]]) -> str:
-    """Generate table showing Petri net size reduction"""
-    # Filter for runs with all optimizations enabled
-    opt_stats = [s for s in stats if (s['options']['bidirectional_pruning'] and
-                                      s['options']['remove_redundant'] and
-                                      s['options']['generate_less'] and
-                                      s['options']['smart_kleene_order'])]
 
+def generate_pruning_effectiveness_table(opt_stats: Iterable[Dict[str, Any]]) -> str:
+    """Generate table showing Petri net size reduction (runs with all optimizations enabled)"""
     rows = []
     for stat in opt_stats:
-        example_name = Path(stat['example']).stem
+        example_name = example_stem(stat['example'])
+        pn = stat['petri_net']
+        pb = pn['places_before']
+        tb = pn['transitions_before']
 
-        for d in stat['petri_net']['disjuncts']:
+        for d in pn['disjuncts']:
             reduction_pct = 0
-            if stat['petri_net']['transitions_before'] > 0:
-                reduction_pct = (d['removed_transitions'] / stat['petri_net']['transitions_before']) * 100
-
-            rows.append({
-                'Example': f"\\texttt{{{example_name}}}",
-                'Disjunct': str(d['id']),
-                'Places': f"{stat['petri_net']['places_before']} → {d['places_after']}",
-                'Transitions': f"{stat['petri_net']['transitions_before']} → {d['transitions_after']}",
-                'Iterations': str(d['pruning_iterations']),
-                'Reduction': f"{reduction_pct:.1f}\\%"
-            })
+            if tb > 0:
+                reduction_pct = (d['removed_transitions'] / tb) * 100
+
+            rows.append(PRUNING_ROW % (
+                example_name,
+                d['id'],
+                pb, d['places_after'],
+                tb, d['transitions_after'],
+                d['pruning_iterations'],
+                reduction_pct,
+            ))
 
     # Convert to LaTeX
-    latex = "\\begin{tabular}{llcccc}\n"
-    latex += "\\toprule\n"
-    latex += "Example & Disj. & Places & Transitions & Iter. & Reduction \\\\\n"
-    latex += "\\midrule\n"
-
-    for row in rows:
-        latex += " & ".join([row['Example'], row['Disjunct'], row['Places'],
-                           row['Transitions'], row['Iterations'], row['Reduction']]) + " \\\\\n"
+    parts = [
+        "\\begin{tabular}{llcccc}\n",
+        "\\toprule\n",
+        "Example & Disj. & Places & Transitions & Iter. & Reduction \\\\\n",
+        "\\midrule\n",
+    ]
 
-    latex += "\\bottomrule\n"
-    latex += "\\end{tabular}\n"
+    parts.extend(rows)
 
-    return latex
+    parts += [
+        "\\bottomrule\n",
+        "\\end{tabular}\n",
+    ]
 
+    return "".join(parts)
 
-def generate_timing_comparison_table(stats: List[Dict[str, Any]]) -> str:
-    """Generate table comparing times with/without optimizations"""
-    # Group by example
-    by_example = defaultdict(dict)
-
-    for stat in stats:
-        example_name = Path(stat['example']).stem
-        opts_key = 'optimized' if (stat['options']['bidirectional_pruning'] and
-                                  stat['options']['remove_redundant'] and
-                                  stat['options']['generate_less'] and
-                                  stat['options']['smart_kleene_order']) else 'unoptimized'
-
-        by_example[example_name][opts_key] = stat
 
+def generate_timing_comparison_table(by_example: Dict[str, Dict[str, Any]]) -> str:
+    """Generate table comparing times with/without optimizations (by_example from index_stats)"""
     rows = []
     for example, data in sorted(by_example.items()):
         if 'optimized' in data and 'unoptimized' in data:
@@ -166,99 +209,68 @@ def generate_timing_comparison_table(stats: List[Dict[str, Any]]) -> str:
 
             speedup = unopt['total_time_ms'] / opt['total_time_ms'] if opt['total_time_ms'] > 0 else 0
 
-            rows.append({
-                'Example': f"\\texttt{{{example}}}",
-                'Unoptimized': format_time(unopt['total_time_ms']),
-                'Optimized': format_time(opt['total_time_ms']),
-                'Speedup': f"{speedup:.1f}×",
-                'Cert. Create': format_time(opt.get('certificate_creation_time_ms', 0)),
-                'Cert. Check': format_time(opt.get('certificate_checking_time_ms', 0))
-            })
+            # Example, Unopt., Opt., Speedup, Create, Check
+            rows.append((
+                f"\\texttt{{{example}}}",
+                format_time(unopt['total_time_ms']),
+                format_time(opt['total_time_ms']),
+                f"{speedup:.1f}×",
+                format_time(opt.get('certificate_creation_time_ms', 0)),
+                format_time(opt.get('certificate_checking_time_ms', 0)),
+            ))
 
     # Convert to LaTeX
-    latex = "\\begin{tabular}{lccccc}\n"
-    latex += "\\toprule\n"
-    latex += "Example & Unopt. & Opt. & Speedup & Create & Check \\\\\n"
-    latex += "\\midrule\n"
-
-    for row in rows:
-        latex += " & ".join([row['Example'], row['Unoptimized'], row['Optimized'],
-                           row['Speedup'], row['Cert. Create'], row['Cert. Check']]) + " \\\\\n"
-
-    latex += "\\bottomrule\n"
-    latex += "\\end{tabular}\n"
+    parts = [
+        "\\begin{tabular}{lccccc}\n",
+        "\\toprule\n",
+        "Example & Unopt. & Opt. & Speedup & Create & Check \\\\\n",
+        "\\midrule\n",
+    ]
 
-    return latex
+    parts.extend(" & ".join(row) + " \\\\\n" for row in rows)
 
+    parts += [
+        "\\bottomrule\n",
+        "\\end{tabular}\n",
+    ]
 
-def generate_optimization_breakdown_table(stats: List[Dict[str, Any]]) -> str:
-    """Generate table showing impact of individual optimizations"""
-    # Group by example and optimization configuration
-    by_example = defaultdict(dict)
-
-    for stat in stats:
-        example_name = Path(stat['example']).stem
-
-        # Determine optimization configuration key
-        bid = stat['options']['bidirectional_pruning']
-        rem = stat['options']['remove_redundant']
-        gen = stat['options']['generate_less']
-        smart = stat['options']['smart_kleene_order']
-
-        if not any([bid, rem, gen, smart]):
-            opts_key = 'none'
-        elif all([bid, rem, gen, smart]):
-            opts_key = 'all'
-        elif bid and not any([rem, gen, smart]):
-            opts_key = 'bidirectional'
-        elif rem and not any([bid, gen, smart]):
-            opts_key = 'remove_redundant'
-        elif gen and not any([bid, rem, smart]):
-            opts_key = 'generate_less'
-        elif smart and not any([bid, rem, gen]):
-            opts_key = 'smart_kleene'
-        else:
-            continue  # Skip mixed configurations
+    return "".join(parts)
 
-        by_example[example_name][opts_key] = stat
 
+def generate_optimization_breakdown_table(by_example: Dict[str, Dict[str, Any]]) -> str:
+    """Generate table showing impact of individual optimizations (by_example from index_stats)"""
     rows = []
     for example, data in sorted(by_example.items()):
         if 'none' in data and 'all' in data:
-            row = {
-                'Example': f"\\texttt{{{example}}}",
-                'None': format_time(data['none']['total_time_ms']),
-                'All': format_time(data['all']['total_time_ms']),
-            }
-
-            # Add individual optimization times
-            for opt_name, opt_key in [('B', 'bidirectional'), ('R', 'remove_redundant'),
-                                     ('G', 'generate_less'), ('S', 'smart_kleene')]:
-                if opt_key in data:
-                    row[opt_name] = format_time(data[opt_key]['total_time_ms'])
-                else:
-                    row[opt_name] = '--'
-
-            rows.append(row)
+            # Example, No Opt, B, R, G, S, All Opt (-- where an individual optimization wasn't run)
+            rows.append((
+                f"\\texttt{{{example}}}",
+                format_time(data['none']['total_time_ms']),
+                *(format_time(data[opt_key]['total_time_ms']) if opt_key in data else '--'
+                  for opt_key in ('bidirectional', 'remove_redundant', 'generate_less', 'smart_kleene')),
+                format_time(data['all']['total_time_ms']),
+            ))
 
     if not rows:
         return "% No optimization breakdown data available\n"
 
     # Convert to LaTeX
-    latex = "\\begin{tabular}{lcccccc}\n"
-    latex += "\\toprule\n"
-    latex += "Example & No Opt & B & R & G & S & All Opt \\\\\n"
-    latex += "\\midrule\n"
+    parts = [
+        "\\begin{tabular}{lcccccc}\n",
+        "\\toprule\n",
+        "Example & No Opt & B & R & G & S & All Opt \\\\\n",
+        "\\midrule\n",
+    ]
 
-    for row in rows:
-        latex += " & ".join([row['Example'], row['None'], row['B'], row['R'],
-                           row['G'], row['S'], row['All']]) + " \\\\\n"
+    parts.extend(" & ".join(row) + " \\\\\n" for row in rows)
 
-    latex += "\\bottomrule\n"
-    latex += "\\end{tabular}\n"
-    latex += "\n% B = Bidirectional Pruning, R = Remove Redundant, G = Generate Less, S = Smart Kleene Order\n"
+    parts += [
+        "\\bottomrule\n",
+        "\\end{tabular}\n",
+        "\n% B = Bidirectional Pruning, R = Remove Redundant, G = Generate Less, S = Smart Kleene Order\n",
+    ]
 
-    return latex
+    return "".join(parts)
 
 
 def generate_cactus_plot(stats: List[Dict[str, Any]], output_dir: str) -> None:
@@ -270,67 +282,55 @@ def generate_cactus_plot(stats: List[Dict[str, Any]], output_dir: str) -> None:
     # First, get all unique example names
     all_examples = set()
     for stat in stats:
-        example_name = Path(stat['example']).stem
+        example_name = example_stem(stat['example'])
         all_examples.add(example_name)
 
     total_examples = len(all_examples)
     print(f"Total unique examples: {total_examples}")
 
-    # Group by optimization configuration and example
-    config_example_times = defaultdict(lambda: defaultdict(list))
-    config_example_timeouts = defaultdict(lambda: defaultdict(list))
+    # Group by (optimization configuration, example)
+    config_example_times = {}  # (config, example) -> run times in seconds
+    config_example_timeouts = set()  # (config, example) pairs with a timed-out run
 
     for stat in stats:
         # Extract optimization configuration
-        bid = stat['options']['bidirectional_pruning']
-        rem = stat['options']['remove_redundant']
-        gen = stat['options']['generate_less']
-        smart = stat['options']['smart_kleene_order']
+        opts = stat['options']
+        bid, rem, gen, smart = OPTION_FLAGS(opts)
 
         # Create config label
         config_label = f"{'B' if bid else '-'}{'R' if rem else '-'}{'G' if gen else '-'}{'S' if smart else '-'}"
 
         # Get example name
-        example_name = Path(stat['example']).stem
+        example_name = example_stem(stat['example'])
 
         # Get time in seconds
         time_s = stat['total_time_ms'] / 1000.0
 
-        timeout_in_sec = stat['options']['timeout']
+        timeout_in_sec = opts['timeout']
         timeout_in_ms = timeout_in_sec * 1000
 
         # Separate timeouts from successful runs
+        key = (config_label, example_name)
         if stat['result'] == 'timeout' or stat['total_time_ms']>=timeout_in_ms:
-            config_example_timeouts[config_label][example_name].append(time_s)
+            config_example_timeouts.add(key)
         else:
-            config_example_times[config_label][example_name].append(time_s)
+            config_example_times.setdefault(key, []).append(time_s)
 
     # Average times for each example within each configuration
     config_avg_times = defaultdict(dict)
     config_timeouts = defaultdict(set)
 
-    # Process successful runs
-    for config, example_times in config_example_times.items():
-        for example, times in example_times.items():
-            # Average multiple runs of the same example
-            avg_time = sum(times) / len(times)
-            config_avg_times[config][example] = avg_time
+    # Process successful runs, averaging multiple runs of the same example
+    for (config, example), times in config_example_times.items():
+        config_avg_times[config][example] = sum(times) / len(times)
 
-    # Process timeouts
-    for config, example_timeouts in config_example_timeouts.items():
-        for example, times in example_timeouts.items():
-            # Mark this example as timed out for this config
-            config_timeouts[config].add(example)
+    # Mark each timed-out example for its config
+    for config, example in config_example_timeouts:
+        config_timeouts[config].add(example)
 
     # Set up the plot
-    try:
-        plt.style.use('seaborn-v0_8-whitegrid')
-    except:
-        try:
-            plt.style.use('seaborn-whitegrid')
-        except:
-            # Use default style with manual grid
-            pass
+    if CACTUS_STYLE is not None:
+        plt.style.use(CACTUS_STYLE)
     fig, ax = plt.subplots(figsize=(10, 6))
 
     # Define colors for different configurations
@@ -356,27 +356,25 @@ def generate_cactus_plot(stats: List[Dict[str, Any]], output_dir: str) -> None:
         example_times = config_avg_times.get(config, {})
         timeouts = config_timeouts.get(config, set())
 
-        # Get only the examples that were actually solved (not timed out)
-        times_list = list(example_times.values())
-
-        if times_list:
-            # Sort times
-            sorted_times = sorted(times_list)
+        # Get only the examples that were actually solved (not timed out), sorted
+        sorted_times = np.sort(np.fromiter(example_times.values(), dtype=np.float64,
+                                           count=len(example_times)))
 
+        if sorted_times.size:
             # Calculate percentage of total examples solved
             # Each solved example contributes 1/total_examples to the percentage
-            percentages = [(i + 1) / total_examples * 100 for i in range(len(sorted_times))]
+            percentages = np.arange(1, sorted_times.size + 1) / total_examples * 100
 
             # Add starting point at 0% from the beginning of the plot
             # This creates the step function effect
             # Also extend to x_max to show the horizontal line
-            sorted_times_extended = [0] + sorted_times + [x_max]
-            percentages_extended = [0] + percentages + [percentages[-1]]
+            sorted_times_extended = np.concatenate(([0.0], sorted_times, [x_max]))
+            percentages_extended = np.concatenate(([0.0], percentages, percentages[-1:]))
 
             # Plot the step function with label showing solved/total for this config
-            # total_attempted = len(times_list) + len(timeouts)
+            # total_attempted = sorted_times.size + len(timeouts)
             total_attempted = 47
-            label = f"{config} ({len(times_list)}/{total_attempted})"
+            label = f"{config} ({sorted_times.size}/{total_attempted})"
             ax.step(sorted_times_extended, percentages_extended, where='post', linewidth=2.5, label=label,
                     color=colors[idx % len(colors)], alpha=0.8)
         else:
@@ -427,32 +425,38 @@ def generate_cactus_plot(stats: List[Dict[str, Any]], output_dir: str) -> None:
     plt.close()
 
 
-def generate_summary_statistics(stats: List[Dict[str, Any]]) -> str:
-    """Generate summary statistics"""
-    opt_stats = [s for s in stats if (s['options']['bidirectional_pruning'] and
-                                      s['options']['remove_redundant'] and
-                                      s['options']['generate_less'] and
-                                      s['options']['smart_kleene_order'])]
-
-    if not opt_stats:
-        return "\\textit{No statistics available with all optimizations enabled.}\n"
-
-    # Calculate various statistics
-    total_examples = len(opt_stats)
-    serializable = len([s for s in opt_stats if s['result'] == 'serializable'])
-    not_serializable = len([s for s in opt_stats if s['result'] == 'not_serializable'])
-    timeouts = len([s for s in opt_stats if s['result'] == 'timeout'])
-
-    # Average pruning effectiveness
-    pruning_percentages = []
+def generate_summary_statistics(opt_stats: Iterable[Dict[str, Any]]) -> str:
+    """Generate summary statistics (runs with all optimizations enabled; any iterable, consumed once)"""
+    # Calculate various statistics in one pass over the runs
+    total_examples = 0
+    serializable = not_serializable = timeouts = 0
+    total_time_ms = 0
+    pruning_sum = 0
+    pruning_count = 0
     for stat in opt_stats:
-        trans_before = stat['petri_net']['transitions_before']
+        total_examples += 1
+        result = stat['result']
+        if result == 'serializable':
+            serializable += 1
+        elif result == 'not_serializable':
+            not_serializable += 1
+        elif result == 'timeout':
+            timeouts += 1
+        total_time_ms += stat['total_time_ms']
+
+        # Pruning effectiveness
+        pn = stat['petri_net']
+        trans_before = pn['transitions_before']
         if trans_before > 0:
-            total_removed = sum(d['removed_transitions'] for d in stat['petri_net']['disjuncts'])
-            pruning_percentages.append((total_removed / trans_before) * 100)
+            total_removed = sum(d['removed_transitions'] for d in pn['disjuncts'])
+            pruning_sum += (total_removed / trans_before) * 100
+            pruning_count += 1
+
+    if not total_examples:
+        return "\\textit{No statistics available with all optimizations enabled.}\n"
 
-    avg_pruning = sum(pruning_percentages) / len(pruning_percentages) if pruning_percentages else 0
-    avg_time = sum(s['total_time_ms'] for s in opt_stats) / len(opt_stats) if opt_stats else 0
+    avg_pruning = pruning_sum / pruning_count if pruning_count else 0
+    avg_time = total_time_ms / total_examples
 
     summary = f"""\\begin{{itemize}}
 \\item Total examples analyzed: {total_examples}
@@ -482,33 +486,38 @@ def main():
         print("No statistics found!")
         return
 
+    opt_stats, by_example_timing, by_example_breakdown = index_stats(stats)
+
     # Create output directory
     Path(args.output_dir).mkdir(parents=True, exist_ok=True)
 
     # Generate tables
-    print("Generating comprehensive table...")
-    with open(f"{args.output_dir}/comprehensive_stats.tex", 'w') as f:
-        f.write(generate_comprehensive_table(stats))
-
-    print("Generating pruning effectiveness table...")
-    with open(f"{args.output_dir}/pruning_effectiveness.tex", 'w') as f:
-        f.write(generate_pruning_effectiveness_table(stats))
-
-    print("Generating timing comparison table...")
-    with open(f"{args.output_dir}/timing_comparison.tex", 'w') as f:
-        f.write(generate_timing_comparison_table(stats))
-
-    print("Generating optimization breakdown table...")
-    with open(f"{args.output_dir}/optimization_breakdown.tex", 'w') as f:
-        f.write(generate_optimization_breakdown_table(stats))
-
-    print("Generating summary statistics...")
-    with open(f"{args.output_dir}/summary_stats.tex", 'w') as f:
-        f.write(generate_summary_statistics(stats))
-
-    if not args.skip_plot:
-        print("Generating cactus plot...")
-        generate_cactus_plot(stats, args.output_dir)
+    tables = [
+        ("comprehensive table", "comprehensive_stats.tex", lambda: generate_comprehensive_table(stats)),
+        ("pruning effectiveness table", "pruning_effectiveness.tex", lambda: generate_pruning_effectiveness_table(opt_stats)),
+        ("timing comparison table", "timing_comparison.tex", lambda: generate_timing_comparison_table(by_example_timing)),
+        ("optimization breakdown table", "optimization_breakdown.tex", lambda: generate_optimization_breakdown_table(by_example_breakdown)),
+        ("summary statistics", "summary_stats.tex", lambda: generate_summary_statistics(opt_stats)),
+    ]
+
+    def write_table(filename, generate):
+        # The tables contain '→' and '×', so encode as UTF-8 once and write the bytes in one go
+        Path(args.output_dir, filename).write_bytes(generate().encode('utf-8'))
+
+    # The generators only read the shared stats, so they run on worker threads while the
+    # main thread draws the cactus plot (pyplot stays on the main thread).
+    with ThreadPoolExecutor(max_workers=len(tables)) as pool:
+        futures = []
+        for description, filename, generate in tables:
+            print(f"Generating {description}...")
+            futures.append(pool.submit(write_table, filename, generate))
+
+        if not args.skip_plot:
+            print("Generating cactus plot...")
+            generate_cactus_plot(stats, args.output_dir)
+
+        for future in futures:
+            future.result()
 
     print(f"Tables saved to {args.output_dir}")
 
@@ -1,10 +1,8 @@
 #!/usr/bin/env python3
-import json
+import argparse
 import os
 
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
+from _jsonl_loader import load_records
 
 # ───────────────────────────────────────────────────────────────────────────────
 # 1. Paths (hard‐coded)
@@ -13,122 +11,115 @@ JSONL_FILE = "/home/guyamir/RustroverProjects/ser/out/serializability_stats.json
 OUTPUT_DIR = "/home/guyamir/RustroverProjects/ser/tex/figures"
 PLOT_PATH  = os.path.join(OUTPUT_DIR, "petri_size_reduction_plot.pdf")
 
-# ───────────────────────────────────────────────────────────────────────────────
-# 2. Load & filter
-# ───────────────────────────────────────────────────────────────────────────────
-with open(JSONL_FILE, 'r') as f:
-    records = [json.loads(line) for line in f]
-
-df = pd.DataFrame(records)
-
 # keep only rows where all four options are true
-mask = (
-    df["options"].apply(lambda o: o.get("bidirectional_pruning", False)) &
-    df["options"].apply(lambda o: o.get("remove_redundant",    False)) &
-    df["options"].apply(lambda o: o.get("generate_less",       False)) &
-    df["options"].apply(lambda o: o.get("smart_kleene_order",  False))
-)
-df = df[mask]
-
-# ───────────────────────────────────────────────────────────────────────────────
-# 3. First‐seen per example
-# ───────────────────────────────────────────────────────────────────────────────
-df = df.drop_duplicates(subset=["example"], keep="first")
-
-# ───────────────────────────────────────────────────────────────────────────────
-# 4. Build a “long” table with stages
-# ───────────────────────────────────────────────────────────────────────────────
-rows = []
-for _, row in df.iterrows():
-    places_before      = row["petri_net"]["places_before"]
-    trans_before       = row["petri_net"]["transitions_before"]
-    disjuncts          = row["petri_net"].get("disjuncts", [])
-    # pre‐pruning row
-    rows.append({
-        "stage":          "pre_pruning",
-        "num_places":     places_before,
-        "num_transitions":trans_before
-    })
-    # post‐pruning rows
-    if disjuncts:
-        for d in disjuncts:
-            rows.append({
-                "stage":           "post_pruning",
-                "num_places":      d["places_after"],
-                "num_transitions": d["transitions_after"]
-            })
-    else:
-        # if no disjuncts, treat post = pre
-        rows.append({
-            "stage":           "post_pruning",
-            "num_places":      places_before,
-            "num_transitions": trans_before
-        })
-
-long_df = pd.DataFrame(rows)
-
-# ───────────────────────────────────────────────────────────────────────────────
-# 5. Aggregate means
-# ───────────────────────────────────────────────────────────────────────────────
-agg = long_df.groupby("stage").agg({
-    "num_places":     "mean",
-    "num_transitions":"mean"
-}).reindex(["pre_pruning", "post_pruning"])
-
-pre_places  = agg.loc["pre_pruning",  "num_places"]
-post_places = agg.loc["post_pruning", "num_places"]
-pre_trans   = agg.loc["pre_pruning",  "num_transitions"]
-post_trans  = agg.loc["post_pruning", "num_transitions"]
-
-# ───────────────────────────────────────────────────────────────────────────────
-# 6. Plotting
-# ───────────────────────────────────────────────────────────────────────────────
-categories = ["Places", "Transitions"]
-x = np.arange(len(categories))
-width = 0.35
-
-fig, ax = plt.subplots(figsize=(10, 6))
-
-# bars
-ax.bar(x[0] - width/2, pre_places,  width,
-       label="Before",
-       facecolor="forestgreen", edgecolor="black", linewidth=1)
-ax.bar(x[0] + width/2, post_places, width,
-       label="After",
-       facecolor="lightgreen", edgecolor="black", linewidth=1)
-
-ax.bar(x[1] - width/2, pre_trans,   width,
-       facecolor="darkorange", edgecolor="black", linewidth=1)
-ax.bar(x[1] + width/2, post_trans,  width,
-       facecolor="peachpuff", edgecolor="black", linewidth=1)
-
-# annotations
-max_h = max(pre_places, post_places, pre_trans, post_trans)
-yoff  = max_h * 0.02
-fs    = 25
-
-for i, h in enumerate([pre_places, post_places]):
-    xpos = x[0] + (i*2-1)*width/2
-    ax.text(xpos, h + yoff, ["Before", "After"][i],
-            ha="center", fontsize=fs)
-
-for i, h in enumerate([pre_trans, post_trans]):
-    xpos = x[1] + (i*2-1)*width/2
-    ax.text(xpos, h + yoff, ["Before", "After"][i],
-            ha="center", fontsize=fs)
-
-# style
-ax.set_xticks(x)
-ax.set_xticklabels(categories)
-ax.set_ylabel("Average Count", fontsize=fs)
-ax.tick_params(axis='x', labelsize=fs)
-ax.tick_params(axis='y', labelsize=fs)
-ax.set_ylim(0, max_h * 1.1)
-ax.yaxis.grid(True, linestyle="--", linewidth=0.5, alpha=0.7)
-
-fig.tight_layout()
-
-# ensure output dir exists
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-fig.savefig(PLOT_PATH)
-print(f"Plot saved to: {PLOT_PATH}")
+OPTION_KEYS = ("bidirectional_pruning", "remove_redundant", "generate_less", "smart_kleene_order")
+
+
+def average_sizes(records):
+    """Mean places/transitions before and after pruning, first-seen row per example."""
+    # ───────────────────────────────────────────────────────────────────────────
+    # 2. First‐seen per example, accumulating per-stage sums as we go
+    #    (pre-pruning net, post-pruning disjuncts)
+    # ───────────────────────────────────────────────────────────────────────────
+    seen = set()
+    sp_pre = st_pre = n_pre = 0
+    sp_post = st_post = n_post = 0
+    for r in records:
+        if not all(r["options"].get(k, False) for k in OPTION_KEYS):
+            continue
+        if r["example"] in seen:
+            continue
+        seen.add(r["example"])
+        pn = r["petri_net"]
+        places_before      = pn["places_before"]
+        trans_before       = pn["transitions_before"]
+        disjuncts          = pn.get("disjuncts", [])
+        # pre‐pruning
+        sp_pre += places_before
+        st_pre += trans_before
+        n_pre  += 1
+        # post‐pruning
+        if disjuncts:
+            for d in disjuncts:
+                sp_post += d["places_after"]
+                st_post += d["transitions_after"]
+                n_post  += 1
+        else:
+            # if no disjuncts, treat post = pre
+            sp_post += places_before
+            st_post += trans_before
+            n_post  += 1
+
+    # ───────────────────────────────────────────────────────────────────────────
+    # 3. Means
+    # ───────────────────────────────────────────────────────────────────────────
+    return sp_pre / n_pre, sp_post / n_post, st_pre / n_pre, st_post / n_post
+
+
+def plot(pre_places, post_places, pre_trans, post_trans):
+    """Render the before/after bar chart to PLOT_PATH."""
+    # plotting libraries are only needed here; Agg skips GUI backend probing
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    # ───────────────────────────────────────────────────────────────────────────
+    # 4. Plotting
+    # ───────────────────────────────────────────────────────────────────────────
+    categories = ["Places", "Transitions"]
+    x = np.arange(len(categories))
+    width = 0.35
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    # bars: before/after for places, then for transitions, drawn in one call
+    max_h = max(pre_places, post_places, pre_trans, post_trans)
+    fs    = 25
+
+    xs = [x[0] - width/2, x[0] + width/2, x[1] - width/2, x[1] + width/2]
+    hs = [pre_places, post_places, pre_trans, post_trans]
+    ax.bar(
+        xs, hs, width,
+        color=["forestgreen", "lightgreen", "darkorange", "peachpuff"],
+        edgecolor="black", linewidth=1,
+    )
+
+    # annotations, 2% of the tallest bar above each one (data units)
+    yoff = max_h * 0.02
+    for xpos, h, label in zip(xs, hs, ["Before", "After", "Before", "After"]):
+        ax.text(xpos, h + yoff, label, ha="center", fontsize=fs)
+
+    # style
+    ax.set_xticks(x)
+    ax.set_xticklabels(categories)
+    ax.set_ylabel("Average Count", fontsize=fs)
+    ax.tick_params(axis='x', labelsize=fs)
+    ax.tick_params(axis='y', labelsize=fs)
+    ax.set_ylim(0, max_h * 1.1)
+    ax.yaxis.grid(True, linestyle="--", linewidth=0.5, alpha=0.7)
+
+    fig.tight_layout()
+
+    # ensure output dir exists
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    fig.savefig(PLOT_PATH)
+    print(f"Plot saved to: {PLOT_PATH}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plot average Petri net size before/after pruning")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Print the averages without importing matplotlib or writing the plot")
+    args = parser.parse_args()
+
+    sizes = average_sizes(load_records(JSONL_FILE))
+    if args.dry_run:
+        print("places: {:.2f} -> {:.2f}, transitions: {:.2f} -> {:.2f}".format(
+            sizes[0], sizes[1], sizes[2], sizes[3]))
+        return
+    plot(*sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,11 @@
 import os
 import sys
 import math
-import json
+import numpy as np
 import pandas as pd
 
+from _jsonl_loader import load_records
+
 # ───────────────────────────────────────────────────────────────────────────────
 # 1. Paths (hard‐coded)
 # ───────────────────────────────────────────────────────────────────────────────
@@ -12,14 +14,22 @@ JSONL_FILE = "out/serializability_stats.jsonl"
 OUTPUT_TEX = "tex/tables/semilinear_size_reduction.tex"
 
 # ───────────────────────────────────────────────────────────────────────────────
-# 2. Load JSONL into DataFrame and expand the 'options' dict
+# 2. Load JSONL into DataFrame with the 'options' dict flattened
 # ───────────────────────────────────────────────────────────────────────────────
-with open(JSONL_FILE, "r") as f:
-    records = [json.loads(line) for line in f]
-df = pd.DataFrame(records)
+records = load_records(JSONL_FILE)
 
-opts = df["options"].apply(pd.Series)
-df = pd.concat([df.drop(columns=["options"]), opts], axis=1)
+# build the frame in one go from just the fields used below, with the four
+# optimization switches already flattened into bool columns
+KEEP_COLS = ("example", "result", "timestamp", "semilinear_set")
+OPTION_KEYS = ("bidirectional_pruning", "remove_redundant", "generate_less", "smart_kleene_order")
+df = pd.DataFrame(
+    [
+        {**{k: r.get(k) for k in KEEP_COLS},
+         **{k: r["options"].get(k, False) for k in OPTION_KEYS}}
+        for r in records
+    ],
+    columns=[*KEEP_COLS, *OPTION_KEYS],
+)
 
 # ───────────────────────────────────────────────────────────────────────────────
 # 2.5. Remove *entire* examples that ever timed out in any scenario
@@ -27,8 +37,9 @@ df = pd.concat([df.drop(columns=["options"]), opts], axis=1)
 # this is because there are instances that we short-circuit T.O. if the semilinear set is too large
 # find all examples with at least one timeout
 timeout_examples = set(df.loc[df["result"] == "timeout", "example"])
-# drop them entirely
-df = df[~df["example"].isin(timeout_examples)].copy()
+# drop them entirely; sort the rest once (stably) so every scenario below can
+# take its first row per example without re-sorting
+df = df[~df["example"].isin(timeout_examples)].sort_values("timestamp", kind="mergesort")
 
 # ───────────────────────────────────────────────────────────────────────────────
 # 3. Define the four target optimization scenarios
@@ -63,28 +74,30 @@ scenarios = {
 # ───────────────────────────────────────────────────────────────────────────────
 # 4. Find examples present under *all* four scenarios
 # ───────────────────────────────────────────────────────────────────────────────
+# one row-wise compare of the option matrix against each scenario's switches
+opts_mat = df[list(OPTION_KEYS)].to_numpy(dtype=bool)
+scenario_masks = {
+    name: (opts_mat == np.array([combo[k] for k in OPTION_KEYS], dtype=bool)).all(axis=1)
+    for name, combo in scenarios.items()
+}
+
 sets = []
-for combo in scenarios.values():
-    mask = pd.Series(True, index=df.index)
-    for k, v in combo.items():
-        mask &= (df[k] == v)
+for mask in scenario_masks.values():
     sets.append(set(df.loc[mask, "example"].unique()))
 
 common_examples = set.intersection(*sets)
 if not common_examples:
     print("Error: no examples appear in all four scenarios → nothing to tabulate.")
     sys.exit(1)
+in_common = df["example"].isin(common_examples).to_numpy()
 
 # ───────────────────────────────────────────────────────────────────────────────
 # 5. Per‐scenario, keep only the first row per example
 # ───────────────────────────────────────────────────────────────────────────────
 filtered = {}
-for name, combo in scenarios.items():
-    mask = pd.Series(True, index=df.index)
-    for k, v in combo.items():
-        mask &= (df[k] == v)
-    sub = df.loc[mask & df["example"].isin(common_examples)].copy()
-    sub = sub.sort_values("timestamp").drop_duplicates("example", keep="first")
+for name, mask in scenario_masks.items():
+    sub = df.loc[mask & in_common]
+    sub = sub.drop_duplicates("example", keep="first")
     filtered[name] = sub
 
 # ───────────────────────────────────────────────────────────────────────────────
@@ -92,18 +105,16 @@ for name, combo in scenarios.items():
 # ───────────────────────────────────────────────────────────────────────────────
 stats = {}
 for name, sub in filtered.items():
-    # num_components
-    num_comps = sub["semilinear_set"].apply(lambda s: s["num_components"])
-    # avg periods per comp, per example
-    avg_periods = sub["semilinear_set"].apply(
-        lambda s: (
-            sum(c["periods"] for c in s["components"]) / s["num_components"]
-        ) if s["num_components"] > 0 else 0
-    )
-    # max periods per comp, per example
-    max_periods = sub["semilinear_set"].apply(
-        lambda s: max((c["periods"] for c in s["components"]), default=0)
-    )
+    # num_components, avg and max periods per comp, per example; one pass
+    num_comps = np.empty(len(sub))
+    avg_periods = np.empty(len(sub))
+    max_periods = np.empty(len(sub))
+    for i, sl in enumerate(sub["semilinear_set"].values):
+        n = sl["num_components"]
+        periods = [c["periods"] for c in sl["components"]]
+        num_comps[i] = n
+        avg_periods[i] = (sum(periods) / n) if n > 0 else 0
+        max_periods[i] = max(periods, default=0)
     stats[name] = {
         "mean_num_components": num_comps.mean(),
         "max_num_components":  num_comps.max(),
@@ -116,51 +127,40 @@ for name, sub in filtered.items():
 # ───────────────────────────────────────────────────────────────────────────────
 stats_df = pd.DataFrame.from_dict(stats, orient="index")
 
-max_mean_comps = stats_df["mean_num_components"].max()
-max_max_comps  = stats_df["max_num_components"].max()
-max_mean_per   = stats_df["mean_periods"].max()
-max_max_per    = stats_df["max_periods"].max()
+# one compare against the column maxima marks every cell to bold
+values = stats_df.to_numpy()
+is_max = values == values.max(axis=0)
 
 # ───────────────────────────────────────────────────────────────────────────────
 # 8. Formatters (and bold the maxima)
 # ───────────────────────────────────────────────────────────────────────────────
 def fmt_float(x):
-    s = f"{x:,.2f}"
-    return s.replace(",", "{,}")
+    return format(x, ",.2f").replace(",", "{,}")
     # always round upward, then format as integer
     #return fmt_int(math.ceil(x))
 
 def fmt_int(x):
-    s = f"{int(x):,}"
-    return s.replace(",", "{,}")
+    n = int(x)
+    # no thousands separator below 1000, so skip the grouping work
+    if -1000 < n < 1000:
+        return str(n)
+    return format(n, ",").replace(",", "{,}")
+
+# formatter per stats_df column: mean/max components, mean/max periods
+COLUMN_FMTS = (fmt_float, fmt_int, fmt_float, fmt_int)
 
 rows = []
-for name, row in stats_df.iterrows():
-    scen = name.replace("_", "\\_")
-    # mean components
-    mnc = fmt_float(row["mean_num_components"])
-    if row["mean_num_components"] == max_mean_comps:
-        mnc = f"\\textbf{{{mnc}}}"
-    # max components
-    xnc = fmt_int(row["max_num_components"])
-    if row["max_num_components"] == max_max_comps:
-        xnc = f"\\textbf{{{xnc}}}"
-    # mean periods
-    mp = fmt_float(row["mean_periods"])
-    if row["mean_periods"] == max_mean_per:
-        mp = f"\\textbf{{{mp}}}"
-    # max periods
-    xp = fmt_int(row["max_periods"])
-    if row["max_periods"] == max_max_per:
-        xp = f"\\textbf{{{xp}}}"
-    rows.append((scen, mnc, xnc, mp, xp))
+for name, vals, bold in zip(stats_df.index, values, is_max):
+    cells = [name.replace("_", "\\_")]
+    for fmt, v, b in zip(COLUMN_FMTS, vals, bold):
+        cell = fmt(v)
+        cells.append(f"\\textbf{{{cell}}}" if b else cell)
+    rows.append(" & ".join(cells))
 
 # ───────────────────────────────────────────────────────────────────────────────
 # 9. Emit the LaTeX table
 # ───────────────────────────────────────────────────────────────────────────────
-os.makedirs(os.path.dirname(OUTPUT_TEX), exist_ok=True)
-with open(OUTPUT_TEX, "w") as f:
-    f.write(r"""\begin{table}[H]
+parts = [r"""\begin{table}[H]
 	\centering
 	\begin{tabular}{l c c c c}
 		\toprule
@@ -168,12 +168,16 @@ with open(OUTPUT_TEX, "w") as f:
 		\cmidrule(lr){2-3} \cmidrule(lr){4-5}
 		& average & max & average & max \\
 		\midrule
-""")
-    for scen, mnc, xnc, mp, xp in rows:
-        f.write(f"	{scen} & {mnc} & {xnc} & {mp} & {xp} \\\\\n")
-    f.write(r"""  \bottomrule
+"""]
+for row in rows:
+    parts.append(f"	{row} \\\\\n")
+parts.append(r"""  \bottomrule
 	\end{tabular}
 \end{table}
 """)
 
+os.makedirs(os.path.dirname(OUTPUT_TEX), exist_ok=True)
+with open(OUTPUT_TEX, "w") as f:
+    f.write("".join(parts))
+
 print(f"Wrote LaTeX table to: {OUTPUT_TEX}")
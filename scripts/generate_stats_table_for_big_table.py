@@ -1,61 +1,62 @@
 #!/usr/bin/env python3
-import pandas as pd
+import csv
+
+import numpy as np
 
 INPUT_CSV_PATH = "out/jsonl_summarizing_table.csv"
 OUT_TEX_TABLE_PATH = "tex/tables/average_and_mean_values_of_big_table.tex"
 
+# Column names
+CERT_COL   = "certificate running time"
+TOTAL_COL  = "total running time"
+RESULT_COL = "result"
+
 def format_int(value: float) -> str:
     """Round a float to the nearest integer and return as string."""
     return str(int(round(value)))
 
-def compute_stats(df: pd.DataFrame, col: str):
-    """Return average and median (rounded to int) for a column."""
-    return format_int(df[col].mean()), format_int(df[col].median())
+def compute_stats(values: np.ndarray):
+    """Return average and median (rounded to int) of the non-missing values."""
+    return format_int(np.nanmean(values)), format_int(np.nanmedian(values))
+
+def read_columns(csv_path):
+    """Read the result column and both timing columns in one pass; empty times become NaN."""
+    results, cert, total = [], [], []
+    with open(csv_path, newline="") as f:
+        for row in csv.DictReader(f):
+            results.append(row[RESULT_COL])
+            cert.append(float(row[CERT_COL]) if row[CERT_COL] else np.nan)
+            total.append(float(row[TOTAL_COL]) if row[TOTAL_COL] else np.nan)
+    return np.asarray(results), np.asarray(cert), np.asarray(total)
 
 def main():
     # Read input CSV
-    df = pd.read_csv(INPUT_CSV_PATH)
-
-    # Column names
-    cert_col   = "certificate running time"
-    total_col  = "total running time"
-    result_col = "result"
-    val_col    = "certificate validation"
+    results, cert, total = read_columns(INPUT_CSV_PATH)
 
     # Compute validation time column
-    df[val_col] = df[total_col] - df[cert_col]
+    val = total - cert
 
     # Masks for categories
-    ser     = df[result_col] == "serializable"
-    non_ser = df[result_col] == "not_serializable"
+    groups = {
+        "Serializable":     results == "serializable",
+        "Not serializable": results == "not_serializable",
+        "All":              slice(None),
+    }
 
     # Compute stats for each group
-    stats = {
-        "Serializable": {
-            "cert_avg": compute_stats(df[ser],     cert_col)[0],
-            "cert_med": compute_stats(df[ser],     cert_col)[1],
-            "val_avg":  compute_stats(df[ser],     val_col)[0],
-            "val_med":  compute_stats(df[ser],     val_col)[1],
-            "tot_avg":  compute_stats(df[ser],     total_col)[0],
-            "tot_med":  compute_stats(df[ser],     total_col)[1],
-        },
-        "Not serializable": {
-            "cert_avg": compute_stats(df[non_ser], cert_col)[0],
-            "cert_med": compute_stats(df[non_ser], cert_col)[1],
-            "val_avg":  compute_stats(df[non_ser], val_col)[0],
-            "val_med":  compute_stats(df[non_ser], val_col)[1],
-            "tot_avg":  compute_stats(df[non_ser], total_col)[0],
-            "tot_med":  compute_stats(df[non_ser], total_col)[1],
-        },
-        "All": {
-            "cert_avg": compute_stats(df,           cert_col)[0],
-            "cert_med": compute_stats(df,           cert_col)[1],
-            "val_avg":  compute_stats(df,           val_col)[0],
-            "val_med":  compute_stats(df,           val_col)[1],
-            "tot_avg":  compute_stats(df,           total_col)[0],
-            "tot_med":  compute_stats(df,           total_col)[1],
-        },
-    }
+    stats = {}
+    for cat, sel in groups.items():
+        cert_avg, cert_med = compute_stats(cert[sel])
+        val_avg,  val_med  = compute_stats(val[sel])
+        tot_avg,  tot_med  = compute_stats(total[sel])
+        stats[cat] = {
+            "cert_avg": cert_avg,
+            "cert_med": cert_med,
+            "val_avg":  val_avg,
+            "val_med":  val_med,
+            "tot_avg":  tot_avg,
+            "tot_med":  tot_med,
+        }
 
     # Build LaTeX table
     lines = []
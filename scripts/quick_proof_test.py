@@ -1,6 +1,14 @@
 #!/usr/bin/env python3
+import os
 import subprocess
 import re
+from concurrent.futures import ThreadPoolExecutor
+
+from _ser_binary import ensure_built
+
+OUTSIDE_RE = re.compile(r"Values outside serializable set: ([^\n]+)")
+PANIC_RE = re.compile(r"panicked at (.+)")
+PARSE_ERROR_RE = re.compile(r'ParseError \{ message: "([^"]+)"')
 
 # Test just a few specific examples
 test_files = [
@@ -10,14 +18,17 @@ test_files = [
     "examples/json/small/pattern_minimal_nonser.json"
 ]
 
-for i, file_path in enumerate(test_files):
-    print(f"\n{'='*60}")
-    print(f"[{i+1}/{len(test_files)}] Testing: {file_path}")
-    print('='*60)
+def run_one(binary, idx_path):
+    """Test one file and return its report as a single string"""
+    i, file_path = idx_path
+    lines = []
+    lines.append(f"\n{'='*60}")
+    lines.append(f"[{i+1}/{len(test_files)}] Testing: {file_path}")
+    lines.append('='*60)
     
     try:
         result = subprocess.run(
-            ["cargo", "run", "--", file_path],
+            [str(binary), file_path],
             capture_output=True,
             text=True,
             timeout=10
@@ -28,39 +39,55 @@ for i, file_path in enumerate(test_files):
         
         # Check result
         if "✅ The network system IS serializable" in output:
-            print("Result: SERIALIZABLE")
+            lines.append("Result: SERIALIZABLE")
         elif "❌ The network system is NOT serializable" in output:
-            print("Result: NOT SERIALIZABLE")
+            lines.append("Result: NOT SERIALIZABLE")
         else:
-            print("Result: UNKNOWN")
+            lines.append("Result: UNKNOWN")
         
         # Check proof status
         if "✅ Proof certificate is VALID" in output:
-            print("Proof: VALID")
+            lines.append("Proof: VALID")
         elif "❌ Proof certificate is INVALID" in output:
-            print("Proof: INVALID")
+            lines.append("Proof: INVALID")
             
             # Find reason
             if "Invariant for global state" in output and "does not imply serializability" in output:
-                print("Issue: Invariant contains values outside serializable set")
+                lines.append("Issue: Invariant contains values outside serializable set")
                 
                 # Extract details
-                outside_match = re.search(r"Values outside serializable set: ([^\n]+)", output)
+                outside_match = OUTSIDE_RE.search(output)
                 if outside_match:
-                    print(f"Details: {outside_match.group(1)}")
+                    lines.append(f"Details: {outside_match.group(1)}")
         
         # Check for errors
         if "thread 'main' panicked" in result.stderr:
-            panic_match = re.search(r"panicked at (.+)", result.stderr)
+            panic_match = PANIC_RE.search(result.stderr)
             if panic_match:
-                print(f"ERROR: Panic at {panic_match.group(1)}")
+                lines.append(f"ERROR: Panic at {panic_match.group(1)}")
         
         if "Failed to parse proof certificate" in output:
-            parse_match = re.search(r'ParseError \{ message: "([^"]+)"', output)
+            parse_match = PARSE_ERROR_RE.search(output)
             if parse_match:
-                print(f"ERROR: Parse error - {parse_match.group(1)}")
+                lines.append(f"ERROR: Parse error - {parse_match.group(1)}")
                 
     except subprocess.TimeoutExpired:
-        print("ERROR: TIMEOUT")
+        lines.append("ERROR: TIMEOUT")
     except Exception as e:
-        print(f"ERROR: {str(e)}")
\ No newline at end of file
+        lines.append(f"ERROR: {str(e)}")
+    
+    return "\n".join(lines)
+
+
+def main():
+    # Build once up front; each test then runs the binary without cargo's overhead
+    binary = ensure_built()
+
+    # Each run is an independent subprocess, so threads are enough to overlap them
+    with ThreadPoolExecutor(max_workers=min(len(test_files), os.cpu_count() or 1)) as ex:
+        for report in ex.map(lambda item: run_one(binary, item), enumerate(test_files)):
+            print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,23 +5,58 @@ Runs the analysis multiple times and compares the outputs.
 """
 
 import os
+import re
+import mmap
 import subprocess
 import shutil
 import difflib
 import hashlib
 from datetime import datetime
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 
-def run_analysis(run_num, output_dir, timeout=10):
-    """Run analyze_examples.py and save the report."""
+def link_or_copy(src, dst):
+    """Hardlink dst to src so no data is copied, falling back to a copy across filesystems."""
+    if os.path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def prepare_run_dir(run_dir):
+    """Create a fresh working directory for one analysis, linking in what it reads from its cwd."""
+    if os.path.exists(run_dir):
+        shutil.rmtree(run_dir)
+    os.makedirs(run_dir)
+    # analyze_examples.py globs examples/ relative to its cwd, and the checker
+    # looks for ./smpt_wrapper.sh before falling back to python3 -m smpt
+    for name in ("examples", "smpt_wrapper.sh"):
+        if os.path.exists(name):
+            os.symlink(os.path.abspath(name), os.path.join(run_dir, name))
+
+
+def run_analysis(run_num, output_dir, timeout=10, run_dir=None, jobs=None, keep_source=True):
+    """Run analyze_examples.py and save the report.
+    
+    The checker rewrites out/<example>/ and appends to out/serializability_stats.jsonl
+    under its working directory, so concurrent runs each need their own run_dir to run in.
+    With keep_source=False the report is moved out of place instead of copied.
+    """
     print(f"Run {run_num}: Running analysis...")
     
     # Run the analysis
-    cmd = ["python3", "scripts/analyze_examples.py", "--timeout", str(timeout)]
+    cmd = ["python3", os.path.abspath("scripts/analyze_examples.py"), "--timeout", str(timeout)]
+    if jobs:
+        cmd += ["--jobs", str(jobs)]
+    if run_dir is not None:
+        prepare_run_dir(run_dir)
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = subprocess.run(cmd, capture_output=True, text=True, cwd=run_dir)
         if result.returncode != 0:
             print(f"  Error: {result.stderr}")
             return False
@@ -29,11 +64,15 @@ def run_analysis(run_num, output_dir, timeout=10):
         print(f"  Exception: {e}")
         return False
     
-    # Copy the report to the output directory
-    src_report = "out/serializability_report.md"
+    # Save the report to the output directory
+    src_report = os.path.join(run_dir or "", "out", "serializability_report.md")
     if os.path.exists(src_report):
         dst_report = os.path.join(output_dir, f"report_{run_num:03d}.md")
-        shutil.copy2(src_report, dst_report)
+        if keep_source:
+            # A copy, not a link: the next run writes its report at the same path
+            shutil.copy2(src_report, dst_report)
+        else:
+            shutil.move(src_report, dst_report)
         print(f"  Report saved to {dst_report}")
         return True
     else:
@@ -43,60 +82,107 @@ def run_analysis(run_num, output_dir, timeout=10):
 
 def compute_file_hash(filepath):
     """Compute SHA-256 hash of a file."""
-    sha256_hash = hashlib.sha256()
     with open(filepath, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: C-level read loop
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        sha256_hash = hashlib.sha256()
+        for byte_block in iter(lambda: f.read(1 << 17), b""):
             sha256_hash.update(byte_block)
     return sha256_hash.hexdigest()
 
 
+_TIMESTAMP_MARKERS = ('Generated at:', 'Analysis timestamp:')
+# Table lines with a timing cell (e.g. "| 0.123s |")
+_TIMED_LINE_RE = re.compile(r'^.*s \|.*$', re.M)
+
+
+def _normalize_timed_line(match):
+    """Mask the timings in one table line, cell by cell, collapsing whitespace in those cells."""
+    parts = match.group().split('|')
+    for i, part in enumerate(parts):
+        if 's' in part and any(c.isdigit() for c in part):
+            # Replace numeric values before 's' with 'X'
+            words = part.split()
+            for j, word in enumerate(words):
+                if word.endswith('s') and len(word) > 1:
+                    if word[:-1].replace('.', '').isdigit():
+                        words[j] = 'X.XXXs'
+            parts[i] = ' '.join(words)
+    return '|'.join(parts)
+
+
 def normalize_report(content):
-    """Normalize report content by removing timestamps and other variable elements."""
-    lines = content.split('\n')
-    normalized_lines = []
-    
-    for line in lines:
-        # Skip lines that contain timestamps or dates
-        if 'Generated at:' in line or 'Analysis timestamp:' in line:
-            continue
-        # Remove timing information (e.g., "0.123s" -> "Xs")
-        # This regex-free approach looks for patterns like digit.digit+s
-        if 's |' in line and any(c.isdigit() for c in line):
-            # Simple normalization of timing values
-            parts = line.split('|')
-            for i, part in enumerate(parts):
-                if 's' in part and any(c.isdigit() for c in part):
-                    # Replace numeric values before 's' with 'X'
-                    words = part.split()
-                    for j, word in enumerate(words):
-                        if word.endswith('s') and len(word) > 1:
-                            if word[:-1].replace('.', '').isdigit():
-                                words[j] = 'X.XXXs'
-                    parts[i] = ' '.join(words)
-            line = '|'.join(parts)
-        normalized_lines.append(line)
-    
-    return '\n'.join(normalized_lines)
+    """Normalize report content by removing timestamps and other variable elements.
 
+    >>> normalize_report("| `x` |Serializable|0.12s |ok|") == normalize_report("| `x` |Serializable|0.57s |ok|")
+    True
+    >>> normalize_report("| `x` |  0.12s |ok|")
+    '| `x` |X.XXXs|ok|'
+    """
+    # Skip lines that contain timestamps or dates
+    if any(marker in content for marker in _TIMESTAMP_MARKERS):
+        content = '\n'.join(line for line in content.split('\n')
+                            if not any(marker in line for marker in _TIMESTAMP_MARKERS))
+    # Remove timing information in table lines (e.g., "0.123s" -> "X.XXXs")
+    return _TIMED_LINE_RE.sub(_normalize_timed_line, content)
 
-def compare_reports(report1_path, report2_path):
-    """Compare two reports and return differences."""
-    with open(report1_path, 'r') as f1:
-        content1 = f1.read()
-    with open(report2_path, 'r') as f2:
-        content2 = f2.read()
-    
-    # First check if files are byte-identical
-    if content1 == content2:
+
+@lru_cache(maxsize=None)
+def read_report(report_path):
+    """Read a report once; reports don't change after a run."""
+    with open(report_path, 'r') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def normalized_content(content):
+    """normalize_report, memoized by content: byte-identical reports are normalized once."""
+    return normalize_report(content)
+
+
+def existing_reports(output_dir, num_runs):
+    """{run number: report path} for the runs that produced a report, in run order."""
+    reports = {}
+    for i in range(1, num_runs + 1):
+        report = os.path.join(output_dir, f"report_{i:03d}.md")
+        if os.path.exists(report):
+            reports[i] = report
+    return reports
+
+
+def same_bytes(path1, path2):
+    """Raw byte equality of two files, compared through mmap without decoding either."""
+    size = os.path.getsize(path1)
+    if size != os.path.getsize(path2):
+        return False
+    if size == 0:
+        return True  # empty files can't be mapped
+    with open(path1, 'rb') as f1, open(path2, 'rb') as f2, \
+            mmap.mmap(f1.fileno(), 0, access=mmap.ACCESS_READ) as m1, \
+            mmap.mmap(f2.fileno(), 0, access=mmap.ACCESS_READ) as m2, \
+            memoryview(m1) as v1, memoryview(m2) as v2:
+        return v1 == v2
+
+
+def compare_reports(report1_path, report2_path, with_diff=True):
+    """Compare two reports and return differences (the unified diff only when with_diff is set)."""
+    # First check if files are byte-identical, before decoding either one
+    if same_bytes(report1_path, report2_path):
         return True, []
     
+    content1 = read_report(report1_path)
+    content2 = read_report(report2_path)
+    
     # Normalize and compare
-    norm1 = normalize_report(content1)
-    norm2 = normalize_report(content2)
+    norm1 = normalized_content(content1)
+    norm2 = normalized_content(content2)
     
     if norm1 == norm2:
         return True, ["Files differ only in timestamps/timing"]
     
+    if not with_diff:
+        return False, []
+    
     # Generate detailed diff
     diff = list(difflib.unified_diff(
         norm1.splitlines(keepends=True),
@@ -120,22 +206,34 @@ def create_diff_matrix(output_dir, num_runs):
         print(f" R{i:02d}", end="")
     print()
     
-    # Compare all pairs
+    # Number each distinct report content once, so byte-identical pairs need no comparison
+    reports = existing_reports(output_dir, num_runs)
+    content_ids = {}
+    run_content = {i: content_ids.setdefault(read_report(report), len(content_ids))
+                   for i, report in reports.items()}
+    
+    # Compare all pairs (each unordered pair once; the matrix is symmetric)
     diff_details = {}
+    pair_results = {}
     for i in range(1, num_runs + 1):
         print(f"R{i:02d}: ", end="")
         for j in range(1, num_runs + 1):
             if i == j:
                 print("  - ", end="")
             else:
-                report1 = os.path.join(output_dir, f"report_{i:03d}.md")
-                report2 = os.path.join(output_dir, f"report_{j:03d}.md")
-                
-                if not os.path.exists(report1) or not os.path.exists(report2):
+                if i not in run_content or j not in run_content:
                     print("  ? ", end="")
                     continue
+                if run_content[i] == run_content[j]:
+                    print("  ✓ ", end="")
+                    continue
                 
-                identical, diff = compare_reports(report1, report2)
+                diff_key = (min(i, j), max(i, j))
+                if diff_key not in pair_results:
+                    # Labels only; diffs are generated when a pair is actually saved
+                    pair_results[diff_key] = compare_reports(reports[diff_key[0]], reports[diff_key[1]],
+                                                             with_diff=False)
+                identical, diff = pair_results[diff_key]
                 if identical:
                     if diff:  # Timing differences only
                         print("  ~ ", end="")
@@ -143,16 +241,19 @@ def create_diff_matrix(output_dir, num_runs):
                         print("  ✓ ", end="")
                 else:
                     print("  ✗ ", end="")
-                    diff_key = (min(i, j), max(i, j))
                     if diff_key not in diff_details:
-                        diff_details[diff_key] = diff
+                        diff_details[diff_key] = (reports[diff_key[0]], reports[diff_key[1]])
         print()
     
     return diff_details
 
 
 def save_diff_reports(output_dir, diff_details):
-    """Save detailed diff reports for pairs that differ."""
+    """Save detailed diff reports for pairs that differ.
+
+    diff_details maps each differing run pair to its two report paths, as
+    returned by create_diff_matrix; the diffs themselves are computed here.
+    """
     if not diff_details:
         print("\nNo significant differences found!")
         return
@@ -163,7 +264,8 @@ def save_diff_reports(output_dir, diff_details):
     print(f"\n=== Detailed Differences ===")
     print(f"Saving {len(diff_details)} diff reports to {diff_dir}/")
     
-    for (i, j), diff in diff_details.items():
+    for (i, j), (report_i, report_j) in diff_details.items():
+        _, diff = compare_reports(report_i, report_j)
         diff_file = os.path.join(diff_dir, f"diff_{i:03d}_vs_{j:03d}.txt")
         with open(diff_file, 'w') as f:
             f.writelines(diff)
@@ -172,38 +274,15 @@ def save_diff_reports(output_dir, diff_details):
 
 def find_equivalence_classes(output_dir, num_runs):
     """Find equivalence classes of reports based on normalized content."""
-    equivalence_classes = []
-    assigned = set()
+    # Two reports are equivalent exactly when their normalized content matches,
+    # so group by it instead of comparing every pair
+    classes_by_content = {}
     
-    for i in range(1, num_runs + 1):
-        if i in assigned:
-            continue
-            
-        report_i = os.path.join(output_dir, f"report_{i:03d}.md")
-        if not os.path.exists(report_i):
-            continue
-            
-        # Start new equivalence class with this report
-        current_class = [i]
-        assigned.add(i)
-        
-        # Find all reports equivalent to this one
-        for j in range(i + 1, num_runs + 1):
-            if j in assigned:
-                continue
-                
-            report_j = os.path.join(output_dir, f"report_{j:03d}.md")
-            if not os.path.exists(report_j):
-                continue
-                
-            identical, _ = compare_reports(report_i, report_j)
-            if identical:
-                current_class.append(j)
-                assigned.add(j)
-        
-        equivalence_classes.append(current_class)
+    for i, report_i in existing_reports(output_dir, num_runs).items():
+        normalized = normalized_content(read_report(report_i))
+        classes_by_content.setdefault(normalized, []).append(i)
     
-    return equivalence_classes
+    return list(classes_by_content.values())
 
 
 def save_class_representatives(output_dir, equivalence_classes):
@@ -218,7 +297,7 @@ def save_class_representatives(output_dir, equivalence_classes):
         dst_report = os.path.join(repr_dir, f"class_{class_idx + 1}_representative.md")
         
         if os.path.exists(src_report):
-            shutil.copy2(src_report, dst_report)
+            link_or_copy(src_report, dst_report)
             
             # Also create a summary file for this class
             summary_file = os.path.join(repr_dir, f"class_{class_idx + 1}_members.txt")
@@ -240,6 +319,9 @@ def main():
                         help="Output directory for reports")
     parser.add_argument("--keep-reports", action="store_true",
                         help="Keep the serializability_report.md file after each run")
+    parser.add_argument("-j", "--parallel", type=int, default=1,
+                        help="Number of analyses to run at once (default: 1). Concurrent runs "
+                             "share the CPUs, which can itself change timeout-sensitive results")
     
     args = parser.parse_args()
     
@@ -250,14 +332,29 @@ def main():
     print()
     
     # Run analyses
-    successful_runs = 0
-    for i in range(1, args.num_runs + 1):
-        if run_analysis(i, args.output_dir, args.timeout):
-            successful_runs += 1
+    if args.parallel > 1:
+        # Each run works in its own scratch dir and gets an equal share of the CPUs
+        cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+        jobs = max(1, cpus // args.parallel)
+        
+        def run_one(i):
+            run_dir = os.path.join(args.output_dir, f"run_{i:03d}")
+            try:
+                return run_analysis(i, args.output_dir, args.timeout, run_dir, jobs, keep_source=False)
+            finally:
+                shutil.rmtree(run_dir, ignore_errors=True)
         
-        # Clean up unless requested to keep
-        if not args.keep_reports and os.path.exists("serializability_report.md"):
-            os.remove("serializability_report.md")
+        with ThreadPoolExecutor(max_workers=args.parallel) as pool:
+            successful_runs = sum(pool.map(run_one, range(1, args.num_runs + 1)))
+    else:
+        successful_runs = 0
+        for i in range(1, args.num_runs + 1):
+            if run_analysis(i, args.output_dir, args.timeout, keep_source=args.keep_reports):
+                successful_runs += 1
+            
+            # Clean up unless requested to keep
+            if not args.keep_reports and os.path.exists("serializability_report.md"):
+                os.remove("serializability_report.md")
     
     print(f"\nSuccessful runs: {successful_runs}/{args.num_runs}")
     
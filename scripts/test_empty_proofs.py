@@ -4,49 +4,84 @@ Test script to check for empty proof files when running fred.ser
 """
 import subprocess
 import os
-import glob
 import shutil
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def run_test(num_runs=5):
-    """Run the test multiple times and check for empty proof files"""
-    empty_proof_counts = []
+from _ser_binary import ensure_built, PROJECT_ROOT
+
+EXAMPLE = PROJECT_ROOT / "examples" / "ser" / "fred.ser"
+
+
+def run_once(binary, i):
+    """One run of the checker on fred.ser; returns (empty, total) proof counts, or None on failure.
     
-    for i in range(num_runs):
-        print(f"\rRun {i+1}/{num_runs}", end="", flush=True)
-        
-        # Clean up previous output
-        if os.path.exists("out/fred"):
-            shutil.rmtree("out/fred")
-        
+    The checker writes to out/<example>/ under its working directory, so each run gets its own
+    scratch directory (out/fred_run_<i>) and concurrent runs never touch each other's files.
+    """
+    run_dir = Path("out") / f"fred_run_{i+1}"
+    if run_dir.exists():
+        shutil.rmtree(run_dir)
+    run_dir.mkdir(parents=True)
+    # The checker looks for ./smpt_wrapper.sh before falling back to python3 -m smpt
+    wrapper = Path("smpt_wrapper.sh")
+    if wrapper.exists():
+        (run_dir / wrapper.name).symlink_to(wrapper.resolve())
+    
+    try:
         # Run the command
         try:
             result = subprocess.run(
-                ["cargo", "run", "--", "examples/ser/fred.ser"],
+                [str(binary), str(EXAMPLE)],
                 capture_output=True,
                 text=True,
-                timeout=30
+                timeout=30,
+                cwd=run_dir
             )
             
             if result.returncode != 0:
                 print(f"\nError on run {i+1}: {result.stderr}")
-                continue
+                return None
                 
         except subprocess.TimeoutExpired:
             print(f"\nTimeout on run {i+1}")
-            continue
-        
-        # Check for empty proof files
-        proof_files = glob.glob("out/fred/smpt_constraints_disjunct_*_proof.txt")
-        empty_count = 0
+            return None
         
-        for proof_file in proof_files:
-            size = os.path.getsize(proof_file)
-            if size == 0:
-                empty_count += 1
+        # Check for empty proof files (one directory scan; sizes come from the DirEntry)
+        try:
+            with os.scandir(run_dir / "out" / "fred") as it:
+                proof_files = [e for e in it
+                               if e.name.startswith("smpt_constraints_disjunct_") and e.name.endswith("_proof.txt")]
+        except FileNotFoundError:
+            proof_files = []
+        empty_count = sum(1 for e in proof_files if e.stat().st_size == 0)
         
-        empty_proof_counts.append((empty_count, len(proof_files)))
+        return empty_count, len(proof_files)
+    finally:
+        shutil.rmtree(run_dir, ignore_errors=True)
+
+
+def run_test(num_runs=5, binary=None, jobs=None):
+    """Run the test multiple times (concurrently, up to jobs at once) and check for empty proof files"""
+    binary = binary or ensure_built()
+    jobs = jobs or min(num_runs, os.cpu_count() or 1)
+    
+    done = 0
+    lock = threading.Lock()
+    
+    def run_and_report(i):
+        nonlocal done
+        counts = run_once(binary, i)
+        with lock:
+            done += 1
+            print(f"\rRun {done}/{num_runs}", end="", flush=True)
+        return counts
+    
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(run_and_report, range(num_runs)))
+    empty_proof_counts = [counts for counts in results if counts is not None]
     
     print("\n\nResults:")
     print(f"Total runs: {len(empty_proof_counts)}")
@@ -82,15 +117,16 @@ def main():
         print("Error: Must run from the SMPT directory (where Cargo.toml is located)")
         sys.exit(1)
     
-    # First, make sure the project builds
+    # First, make sure the project builds (once; runs then call the binary directly)
     print("Building project...")
-    result = subprocess.run(["cargo", "build"], capture_output=True)
-    if result.returncode != 0:
+    try:
+        binary = ensure_built()
+    except subprocess.CalledProcessError:
         print("Error building project")
         sys.exit(1)
     
     # Run the test
-    results = run_test(5)
+    results = run_test(5, binary)
     
     # Save results for comparison
     with open("test_results_with_patch.txt", "w") as f:
@@ -1,7 +1,12 @@
 #!/usr/bin/env python3
+import os
+import signal
 import subprocess
 import re
 import sys
+import tempfile
+
+from _ser_binary import ensure_built
 
 # Test specific examples that showed issues
 test_files = [
@@ -13,6 +18,21 @@ test_files = [
     "examples/json/small/pattern_write_skew_ser.json"
 ]
 
+# Every marker extract_proof_info looks for, so the output is scanned once. The panic
+# message is captured in a lookahead so markers inside it (e.g. a ParseError) still match.
+_INFO_RE = re.compile(
+    r"(?P<ser_yes>✅ The network system IS serializable)"
+    r"|(?P<ser_no>❌ The network system is NOT serializable)"
+    r"|(?P<pv_yes>✅ Proof certificate is VALID)"
+    r"|(?P<pv_no>❌ Proof certificate is INVALID)"
+    r"|(?P<inv_state>Invariant for global state)"
+    r"|(?P<inv_imply>does not imply serializability)"
+    r"|(?P<init_fail>Initial state does not satisfy the invariant)"
+    r"|(?P<main_panic>thread 'main' )?panicked at (?=(?P<panic>.+))"
+    r"|(?P<parse_fail>Failed to parse proof certificate)"
+    r'|ParseError \{ message: "(?P<parse>[^"]+)"'
+)
+
 def extract_proof_info(output):
     """Extract key information about proof verification"""
     info = {
@@ -22,49 +42,94 @@ def extract_proof_info(output):
         "invariant_issue": None
     }
     
-    if "✅ The network system IS serializable" in output:
+    # First occurrence of each marker
+    found = {}
+    main_panicked = False
+    for m in _INFO_RE.finditer(output):
+        key = m.lastgroup
+        if key not in found:
+            found[key] = m.group(key)
+        if key == "panic" and m.group("main_panic"):
+            main_panicked = True
+    
+    if "ser_yes" in found:
         info["serializable"] = True
-    elif "❌ The network system is NOT serializable" in output:
+    elif "ser_no" in found:
         info["serializable"] = False
     
-    if "✅ Proof certificate is VALID" in output:
+    if "pv_yes" in found:
         info["proof_valid"] = True
-    elif "❌ Proof certificate is INVALID" in output:
+    elif "pv_no" in found:
         info["proof_valid"] = False
         
         # Look for specific error
-        if "Invariant for global state" in output and "does not imply serializability" in output:
+        if "inv_state" in found and "inv_imply" in found:
             info["invariant_issue"] = "Invariant contains values outside serializable set"
-        elif "Initial state does not satisfy the invariant" in output:
+        elif "init_fail" in found:
             info["invariant_issue"] = "Initial state check failed"
     
     # Check for panic
-    if "thread 'main' panicked" in output:
-        panic_match = re.search(r"panicked at (.+)", output)
-        if panic_match:
-            info["error"] = f"Panic: {panic_match.group(1)}"
+    if main_panicked:
+        info["error"] = f"Panic: {found['panic']}"
     
     # Check for parse errors
-    if "Failed to parse proof certificate" in output:
-        parse_match = re.search(r'ParseError \{ message: "([^"]+)"', output)
-        if parse_match:
-            info["error"] = f"Parse error: {parse_match.group(1)}"
+    if "parse_fail" in found and "parse" in found:
+        info["error"] = f"Parse error: {found['parse']}"
     
     return info
 
-def run_test(file_path):
+def verification_section(output):
+    """Lines after the "Proof Certificate Verification:" header, up to the next ===/─── rule.
+    
+    Only that slice of the output is split into lines.
+    """
+    header = "Proof Certificate Verification:"
+    start = output.find(header)
+    if start < 0:
+        return []
+    start = output.find("\n", start) + 1
+    if start == 0:
+        return []
+    
+    # The section stops at the first line containing either rule
+    rules = [pos for pos in (output.find("=" * 20, start), output.find("─" * 20, start)) if pos >= 0]
+    if rules:
+        end = output.rfind("\n", start, min(rules))
+        if end < 0:  # the rule is on the first line after the header
+            return []
+        section = output[start:end]
+    else:
+        section = output[start:]
+    # A repeated header line restarts the section rather than being printed
+    return [line for line in section.split("\n") if header not in line]
+
+
+def run_test(file_path, binary):
     """Run the serializability checker and extract results"""
     try:
-        result = subprocess.run(
-            ["cargo", "run", "--", file_path],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
+        # Output goes to temp files rather than pipes: the checker never blocks on a full
+        # pipe, and on timeout nothing waits for a pipe that a grandchild still holds open
+        with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+            proc = subprocess.Popen(
+                [str(binary), file_path],
+                stdout=out,
+                stderr=err,
+                start_new_session=True
+            )
+            try:
+                returncode = proc.wait(timeout=2)
+            except BaseException:
+                # The checker's own children (SMPT) are in the same new session; take them all down
+                os.killpg(proc.pid, signal.SIGKILL)
+                proc.wait()
+                raise
+            out.seek(0)
+            err.seek(0)
+            full_output = (out.read().decode("utf-8", errors="replace") + "\n"
+                           + err.read().decode("utf-8", errors="replace"))
         
-        full_output = result.stdout + "\n" + result.stderr
         info = extract_proof_info(full_output)
-        info["returncode"] = result.returncode
+        info["returncode"] = returncode
         
         return info, full_output
         
@@ -77,11 +142,14 @@ def main():
     print("Testing specific examples with proof generation issues...")
     print("=" * 80)
     
+    # Build once; each test then runs the binary directly instead of paying for cargo run
+    binary = ensure_built()
+    
     for file_path in test_files:
         print(f"\nTesting: {file_path}")
         print("-" * 40)
         
-        info, output = run_test(file_path)
+        info, output = run_test(file_path, binary)
         
         print(f"Serializable: {info.get('serializable', 'Unknown')}")
         print(f"Proof Valid: {info.get('proof_valid', 'Unknown')}")
@@ -98,15 +166,8 @@ def main():
             print("\nRelevant output:")
             
             # Find and print the invariant issue details
-            lines = output.split('\n')
-            in_verification = False
-            for i, line in enumerate(lines):
-                if "Proof Certificate Verification:" in line:
-                    in_verification = True
-                elif in_verification and ("=" * 20 in line or "─" * 20 in line):
-                    break
-                elif in_verification:
-                    print(f"  {line}")
+            for line in verification_section(output):
+                print(f"  {line}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file